@@ -0,0 +1,442 @@
+"""Micro-benchmarks for the read and write hot paths of dataset.
+
+Run the default suite against SQLite (in-memory and on-disk) and store the
+results as JSON::
+
+    python benchmarks/bench.py --output before.json
+
+Scale curves are produced by passing several row counts, and two result
+files can be compared to spot regressions between commits::
+
+    python benchmarks/bench.py --rows 1000,100000,1000000 --output after.json
+    python benchmarks/bench.py --compare before.json after.json
+
+The data is generated from a fixed seed, so runs are reproducible.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sqlalchemy  # noqa: E402
+
+import dataset  # noqa: E402
+from dataset.chunked import ChunkedInsert, ChunkedUpdate  # noqa: E402
+
+SEED = 4711
+WIDE_COLUMNS = 50
+SPARSE_FILL = 5
+
+Rows = list[dict[str, Any]]
+Case = Callable[[dataset.Database, Rows], Callable[[], Any]]
+CASES: dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    """Register a benchmark case.
+
+    A case receives a fresh database and the generated rows. It performs any
+    setup it needs and returns a callable that runs the timed operation.
+    """
+
+    def register(func: Case) -> Case:
+        CASES[name] = func
+        return func
+
+    return register
+
+
+def narrow(count: int) -> Rows:
+    rng = random.Random(SEED)
+    base = datetime(2020, 1, 1)
+    return [
+        {
+            "key": i,
+            "place": f"city-{rng.randrange(100)}",
+            "temperature": rng.uniform(-20, 40),
+            "date": base + timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+def wide(count: int) -> Rows:
+    rng = random.Random(SEED)
+    rows = []
+    for i in range(count):
+        row: dict[str, Any] = {"key": i}
+        for c in range(WIDE_COLUMNS):
+            row[f"col_{c}"] = rng.randrange(1000) if c % 2 else f"value-{c}"
+        rows.append(row)
+    return rows
+
+
+def sparse(count: int) -> Rows:
+    rng = random.Random(SEED)
+    rows = []
+    for i in range(count):
+        row: dict[str, Any] = {"key": i}
+        for c in rng.sample(range(WIDE_COLUMNS), SPARSE_FILL):
+            row[f"col_{c}"] = rng.randrange(1000)
+        rows.append(row)
+    return rows
+
+
+DATASETS: dict[str, Callable[[int], Rows]] = {
+    "narrow": narrow,
+    "wide": wide,
+    "sparse": sparse,
+}
+
+
+@contextmanager
+def open_database(backend: str) -> Iterator[dataset.Database]:
+    if backend == "sqlite-memory":
+        db = dataset.connect("sqlite:///:memory:")
+        try:
+            yield db
+        finally:
+            db.close()
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        db = dataset.connect("sqlite:///" + os.path.join(tmp, "bench.db"))
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+BACKENDS = ("sqlite-memory", "sqlite-file")
+
+
+def _loaded(db: dataset.Database, rows: Rows) -> dataset.Table:
+    table = db["bench"]
+    table.insert_many(rows)
+    table.create_index(["key"])
+    return table
+
+
+@case("insert_many")
+def bench_insert_many(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    return lambda: db["bench"].insert_many(rows)
+
+
+@case("chunked_insert")
+def bench_chunked_insert(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    def run() -> None:
+        with ChunkedInsert(db["bench"]) as inserter:
+            for row in rows:
+                inserter.insert(row)
+
+    return run
+
+
+@case("insert_ignore_many")
+def bench_insert_ignore_many(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = db["bench"]
+    table.insert_many(rows[: len(rows) // 2])
+    return lambda: table.insert_ignore_many(rows, ["key"])
+
+
+@case("load_csv")
+def bench_load_csv(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(
+        buffer, fieldnames=list(dict.fromkeys(k for r in rows for k in r))
+    )
+    writer.writeheader()
+    writer.writerows(rows)
+
+    def run() -> None:
+        buffer.seek(0)
+        db["bench"].load_csv(buffer)
+
+    return run
+
+
+@case("update_many")
+def bench_update_many(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    return lambda: table.update_many(rows, ["key"])
+
+
+@case("chunked_update")
+def bench_chunked_update(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+
+    def run() -> None:
+        with ChunkedUpdate(table, ["key"]) as updater:
+            for row in rows:
+                updater.update(row)
+
+    return run
+
+
+@case("chunked_update_mixed")
+def bench_chunked_update_mixed(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    # Alternate between two column sets, each in varying key order.
+    updates = []
+    for i, row in enumerate(rows):
+        update = {k: v for k, v in row.items() if k == "key" or i % 2 or len(k) > 4}
+        updates.append(dict(reversed(update.items())) if i % 3 else update)
+
+    def run() -> None:
+        with ChunkedUpdate(table, ["key"]) as updater:
+            for update in updates:
+                updater.update(update)
+
+    return run
+
+
+@case("upsert")
+def bench_upsert(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    # Row-by-row upserts are slow, so only touch a bounded sample.
+    sample = rows[:1000]
+    return lambda: table.upsert_many(sample, ["key"])
+
+
+@case("merge_from")
+def bench_merge_from(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows[: len(rows) // 2])
+    return lambda: table.merge_from(rows, ["key"])
+
+
+@case("insert_indexed")
+def bench_insert_indexed(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows[:1])
+    table.create_index(["place"])
+    return lambda: table.insert_many(rows)
+
+
+@case("bulk_load")
+def bench_bulk_load(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows[:1])
+    table.create_index(["place"])
+
+    def run() -> None:
+        with table.bulk_load():
+            table.insert_many(rows)
+
+    return run
+
+
+@case("find")
+def bench_find(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    return lambda: sum(1 for _ in table.find())
+
+
+@case("find_records")
+def bench_find_records(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    db.row_type = dataset.Record
+    return lambda: sum(1 for _ in table.find())
+
+
+@case("find_streamed")
+def bench_find_streamed(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    return lambda: sum(1 for _ in table.find(_streamed=True))
+
+
+@case("find_columns")
+def bench_find_columns(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    return lambda: sum(1 for _ in table.find(_columns=["id", "key"]))
+
+
+@case("find_one")
+def bench_find_one(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    keys = [row["key"] for row in rows[:1000]]
+
+    def run() -> None:
+        for key in keys:
+            table.find_one(key=key)
+
+    return run
+
+
+@case("prepared_lookup")
+def bench_prepared_lookup(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    lookup = table.prepared_lookup("key")
+    keys = [row["key"] for row in rows[:1000]]
+
+    def run() -> None:
+        for key in keys:
+            lookup(key)
+
+    return run
+
+
+@case("cached_find_one")
+def bench_cached_find_one(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    cached = table.cached(max_rows=100)
+    # Repeated lookups of a small set of hot keys.
+    ids = [i % 100 + 1 for i in range(1000)]
+
+    def run() -> None:
+        for id_ in ids:
+            cached.find_one(id=id_)
+
+    return run
+
+
+@case("snapshot")
+def bench_snapshot(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    keys = [row["key"] for row in rows[:1000]]
+
+    def run() -> None:
+        snapshot = table.snapshot(index="key")
+        for key in keys:
+            snapshot.lookup(key=key)
+
+    return run
+
+
+@case("count")
+def bench_count(db: dataset.Database, rows: Rows) -> Callable[[], Any]:
+    table = _loaded(db, rows)
+    return lambda: [table.count() for _ in range(100)]
+
+
+def measure(
+    name: str, data: str, backend: str, rows: Rows, repeat: int
+) -> dict[str, Any]:
+    timings = []
+    for _ in range(repeat):
+        with open_database(backend) as db:
+            run = CASES[name](db, rows)
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "case": name,
+        "dataset": data,
+        "backend": backend,
+        "rows": len(rows),
+        "timings": timings,
+        "min": best,
+        "median": statistics.median(timings),
+        "rows_per_sec": len(rows) / best if best else None,
+    }
+
+
+def result_key(result: dict[str, Any]) -> str:
+    return "{case}/{dataset}/{backend}/{rows}".format(**result)
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run_suite(args: argparse.Namespace) -> dict[str, Any]:
+    results = []
+    for count in args.rows:
+        for data in args.datasets:
+            rows = DATASETS[data](count)
+            for backend in args.backends:
+                for name in args.cases:
+                    result = measure(name, data, backend, rows, args.repeat)
+                    print(
+                        f"{result_key(result):<50} {result['min'] * 1000:10.1f} ms",
+                        file=sys.stderr,
+                    )
+                    results.append(result)
+    return {
+        "meta": {
+            "dataset": dataset.__version__,
+            "sqlalchemy": sqlalchemy.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "revision": git_revision(),
+            "seed": SEED,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(base_path: str, head_path: str) -> None:
+    with open(base_path) as fh:
+        base = {result_key(r): r for r in json.load(fh)["results"]}
+    with open(head_path) as fh:
+        head = {result_key(r): r for r in json.load(fh)["results"]}
+    print(f"{'benchmark':<50} {'base ms':>10} {'head ms':>10} {'ratio':>7}")
+    for key in sorted(base.keys() & head.keys()):
+        before, after = base[key]["min"], head[key]["min"]
+        ratio = after / before if before else float("nan")
+        print(f"{key:<50} {before * 1000:10.1f} {after * 1000:10.1f} {ratio:7.2f}")
+
+
+def _csv(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=lambda v: [int(n) for n in _csv(v)],
+        default=[1000, 10000],
+        help="comma-separated row counts, e.g. 1000,100000,10000000",
+    )
+    parser.add_argument("--cases", type=_csv, default=list(CASES))
+    parser.add_argument("--datasets", type=_csv, default=list(DATASETS))
+    parser.add_argument("--backends", type=_csv, default=list(BACKENDS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASE", "HEAD"),
+        help="compare two JSON result files instead of running",
+    )
+    args = parser.parse_args()
+    if args.compare:
+        compare(*args.compare)
+        return
+    for name in args.cases:
+        if name not in CASES:
+            parser.error(f"unknown case: {name}")
+    report = run_suite(args)
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,18 @@
 import os
 import warnings
+from collections.abc import Sequence
 from typing import Any
 
 from dataset.database import Database
 from dataset.table import Table
-from dataset.util import DatasetError, OutRow, QueryError, RowFactory, row_factory
+from dataset.util import (
+    DatasetError,
+    OutRow,
+    QueryError,
+    Record,
+    RowFactory,
+    row_factory,
+)
 
 # shut up useless SA warning:
 warnings.filterwarnings("ignore", "Unicode type received non-unicode bind param value.")
@@ -17,6 +25,7 @@ __all__ = [
     "DatasetError",
     "OutRow",
     "QueryError",
+    "Record",
     "RowFactory",
     "Table",
     "connect",
@@ -32,6 +41,10 @@ def connect(
     row_type: RowFactory = row_factory,
     sqlite_wal_mode: bool = True,
     on_connect_statements: list[str] | None = None,
+    sqlite_profile: str | None = None,
+    read_urls: Sequence[str] | None = None,
+    read_strategy: str = "round_robin",
+    read_your_writes: float = 0.0,
 ) -> Database:
     """Opens a new connection to a database.
 
@@ -41,7 +54,8 @@ def connect(
     *engine_kwargs* will be directly passed to SQLAlchemy, e.g. set
     *engine_kwargs={'pool_recycle': 3600}* will avoid `DB connection timeout`_.
     Set *row_type* to an alternate dict-like class to change the type of
-    container rows are stored in.::
+    container rows are stored in, e.g. :py:class:`dataset.Record` for compact
+    read-only rows.::
 
         db = dataset.connect('sqlite:///factbook.db')
 
@@ -54,6 +68,28 @@ def connect(
     to on_connect_statements as a set of strings. You can view a full
     `list of PRAGMAs here`_.
 
+    For SQLite, *sqlite_profile* applies a named set of pragmas to every
+    connection: ``bulk_load`` trades durability for write speed
+    (``synchronous=OFF``, a large page cache, memory-mapped I/O and in-memory
+    temporary tables), and ``read_serving`` opens read-only connections with
+    a large cache and memory-mapped I/O. See
+    :py:meth:`Database.sqlite_profile() <dataset.Database.sqlite_profile>` to
+    switch profiles around a single load.
+
+    *read_urls* lists read replicas of the database. Reads made by
+    ``find``, ``count``, ``distinct`` and ``aggregate``, and by
+    ``db.query(..., _readonly=True)``, are spread over the replicas, either
+    in turn (``read_strategy='round_robin'``) or to the one with the fewest
+    open connections (``'least_loaded'``). Writes, schema changes and
+    everything inside a transaction use the primary *url*. Since replicas may
+    lag behind, *read_your_writes* keeps a thread's reads on the primary for
+    that many seconds after its last write.::
+
+        db = dataset.connect('postgresql://primary/app',
+                             read_urls=['postgresql://replica1/app',
+                                        'postgresql://replica2/app'],
+                             read_your_writes=1.0)
+
     .. _SQLAlchemy Engine URL: https://docs.sqlalchemy.org/en/latest/core/engines.html#sqlalchemy.create_engine
     .. _DB connection timeout: https://docs.sqlalchemy.org/en/latest/core/pooling.html#setting-pool-recycle
     .. _list of PRAGMAs here: https://www.sqlite.org/pragma.html
@@ -69,4 +105,8 @@ def connect(
         row_type=row_type,
         sqlite_wal_mode=sqlite_wal_mode,
         on_connect_statements=on_connect_statements,
+        sqlite_profile=sqlite_profile,
+        read_urls=read_urls,
+        read_strategy=read_strategy,
+        read_your_writes=read_your_writes,
     )
@@ -0,0 +1,102 @@
+import logging
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dataset.table import Table
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class FilterUsage:
+    """How often, and at what cost, a set of filter columns was used."""
+
+    columns: tuple[str, ...]
+    calls: int = 0
+    total_time: float = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        if not self.calls:
+            return 0.0
+        return self.total_time / self.calls
+
+
+class IndexAdvisor:
+    """Record the filter columns used against a table and suggest indexes.
+
+    The advisor is attached with :py:meth:`Table.advise_indexes()
+    <dataset.Table.advise_indexes>` and sees the keyword filters of every
+    ``find``, ``count``, ``update`` and ``delete``. Column sets used at least
+    ``min_calls`` times that are not covered by an index are reported by
+    :py:meth:`suggestions`. With ``auto_index`` set, those indexes are created
+    at the start of the next operation on the table.
+    """
+
+    def __init__(
+        self, table: "Table", auto_index: bool = False, min_calls: int = 100
+    ) -> None:
+        self.table = table
+        self.auto_index = auto_index
+        self.min_calls = min_calls
+        self._usage: dict[frozenset[str], FilterUsage] = {}
+        self._checked: set[frozenset[str]] = set()
+        self._pending: list[tuple[str, ...]] = []
+        self._lock = threading.Lock()
+
+    def record(self, columns: Iterable[str], elapsed: float) -> None:
+        """Count one use of the given filter ``columns``."""
+        names = [self.table._get_column_name(c) for c in columns]
+        key = frozenset(n for n in names if self.table.has_column(n))
+        if not key:
+            return
+        with self._lock:
+            usage = self._usage.get(key)
+            if usage is None:
+                usage = FilterUsage(tuple(sorted(key)))
+                self._usage[key] = usage
+            usage.calls += 1
+            usage.total_time += elapsed
+            if (
+                self.auto_index
+                and usage.calls >= self.min_calls
+                and key not in self._checked
+            ):
+                self._checked.add(key)
+                self._pending.append(usage.columns)
+
+    def flush(self) -> None:
+        """Create the indexes queued up in ``auto_index`` mode."""
+        if not self._pending:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for columns in pending:
+            if not self.table.has_index(columns):
+                log.info("Creating index on %s%s", self.table.name, columns)
+                self.table.create_index(columns)
+
+    @property
+    def usage(self) -> list[FilterUsage]:
+        """All recorded filter column sets, most expensive first."""
+        with self._lock:
+            usage = list(self._usage.values())
+        return sorted(usage, key=lambda u: u.total_time, reverse=True)
+
+    def suggestions(self) -> list[FilterUsage]:
+        """Frequently used filter column sets that have no covering index."""
+        return [
+            usage
+            for usage in self.usage
+            if usage.calls >= self.min_calls and not self.table.has_index(usage.columns)
+        ]
+
+    def reset(self) -> None:
+        """Forget all recorded usage."""
+        with self._lock:
+            self._usage.clear()
+            self._checked.clear()
+            self._pending.clear()
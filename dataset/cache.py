@@ -0,0 +1,200 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from sqlalchemy.engine import Dialect
+from sqlalchemy.sql.expression import ClauseElement
+
+from dataset.util import QUERY_STEP, DatasetError, OutRow, ensure_strings
+
+if TYPE_CHECKING:
+    from dataset.table import Table
+
+V = TypeVar("V")
+RowKey = tuple[tuple[str, ...], tuple[Any, ...]]
+
+
+class LRUCache(Generic[V]):
+    """A thread-safe, size-bounded cache with an optional time-to-live.
+
+    Once ``max_size`` entries are held, the least recently used entry is
+    evicted. Entries older than ``ttl`` seconds are treated as missing.
+    ``hits`` and ``misses`` count the outcome of every :py:meth:`get`.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float | None = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored, value = entry
+                if self.ttl is None or time.monotonic() - stored < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def statement_key(statement: ClauseElement, dialect: Dialect) -> tuple[str, str]:
+    """Build a cache key from the compiled SQL and its bound parameters."""
+    compiled = statement.compile(dialect=dialect)
+    params: dict[str, Any] = compiled.params
+    return str(compiled), repr(sorted(params.items()))
+
+
+class CachedTable:
+    """A read-through cache of rows, keyed by primary key.
+
+    Created by :py:meth:`Table.cached() <dataset.Table.cached>`. Lookups by
+    the primary key, or by one of the unique column sets given as ``keys``,
+    are answered from an :py:class:`LRUCache` of at most ``max_rows`` rows,
+    and rows missing from it are read from the table and stored. Other
+    lookups go straight to the table.
+
+    Inserts through the table leave the cache alone. An update or delete
+    filtered on exactly the primary key drops that row, and any other write
+    or schema change clears the cache. Changes made by other processes are
+    only seen after ``ttl`` seconds. Rows read inside a transaction are not
+    cached.
+    """
+
+    def __init__(
+        self,
+        table: "Table",
+        max_rows: int = 1024,
+        ttl: float | None = None,
+        keys: Iterable[str | Sequence[str]] | None = None,
+    ) -> None:
+        self.table = table
+        self.keys: list[tuple[str, ...]] = []
+        if table._primary_id is not False:
+            self.keys.append((table._primary_id,))
+        for key in keys or []:
+            self.keys.append(tuple(ensure_strings(key)))
+        if not self.keys:
+            raise DatasetError("A row cache needs a primary key or unique keys.")
+        self.rows: LRUCache[OutRow] = LRUCache(max_rows, ttl)
+
+    @property
+    def hits(self) -> int:
+        return self.rows.hits
+
+    @property
+    def misses(self) -> int:
+        return self.rows.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.rows.hit_ratio
+
+    def _key(self, filters: Mapping[str, Any]) -> RowKey | None:
+        """The cache key for equality ``filters`` on a cached key, if any."""
+        for columns in self.keys:
+            if len(columns) == len(filters) and all(c in filters for c in columns):
+                values = tuple(filters[c] for c in columns)
+                if any(
+                    v is None or isinstance(v, (list, tuple, set, dict)) for v in values
+                ):
+                    return None
+                return columns, values
+        return None
+
+    def _store(self, row: OutRow) -> None:
+        if self.table.db.in_transaction:
+            return
+        for columns in self.keys:
+            if all(row.get(c) is not None for c in columns):
+                self.rows.set((columns, tuple(row[c] for c in columns)), row)
+
+    def _copy(self, row: OutRow) -> OutRow:
+        return self.table.db.row_type(row.items())
+
+    def find_one(self, **filters: Any) -> OutRow | None:
+        """Get a row by primary or unique key, see :py:meth:`Table.find_one()
+        <dataset.Table.find_one>`."""
+        key = self._key(filters)
+        if key is None:
+            return self.table.find_one(**filters)
+        row = self.rows.get(key)
+        if row is None:
+            row = self.table.find_one(**filters)
+            if row is None:
+                return None
+            self._store(row)
+        return self._copy(row)
+
+    def get_many(self, ids: Iterable[Any]) -> dict[Any, OutRow]:
+        """Get the rows for many primary key values at once.
+
+        Cached rows are returned from memory and all others are loaded with
+        ``IN`` queries. Returns a dict mapping each found key to its row.
+        """
+        if self.table._primary_id is False:
+            raise DatasetError("get_many() needs a primary key.")
+        columns = self.keys[0]
+        found: dict[Any, OutRow] = {}
+        missing: list[Any] = []
+        for value in dict.fromkeys(ids):
+            row = self.rows.get((columns, (value,)))
+            if row is None:
+                missing.append(value)
+            else:
+                found[value] = self._copy(row)
+        if not self.table.exists:
+            return found
+        for offset in range(0, len(missing), QUERY_STEP):
+            chunk = missing[offset : offset + QUERY_STEP]
+            clause = self.table.table.c[columns[0]].in_(chunk)
+            for row in self.table.find(clause):
+                self._store(row)
+                found[row[columns[0]]] = self._copy(row)
+        return found
+
+    def invalidate(self, filters: Mapping[str, Any] | None = None) -> None:
+        """Forget the row matching primary key ``filters``, or all rows."""
+        if filters is not None and len(self.keys) == 1:
+            key = self._key(filters)
+            if key is not None:
+                self.rows.pop(key)
+                return
+        self.rows.clear()
+
+    def clear(self) -> None:
+        self.rows.clear()
+
+    def __len__(self) -> int:
+        return len(self.rows)
@@ -1,8 +1,10 @@
-import itertools
+import queue
+import threading
+from abc import ABC, abstractmethod
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING
 
-from dataset.util import MutableRow, WriteRow
+from dataset.util import DatasetError, MutableRow, WriteRow
 
 if TYPE_CHECKING:
     from dataset.table import Table
@@ -14,12 +16,14 @@ class InvalidCallbackError(ValueError):
     pass
 
 
-class _Chunker:
+class _Chunker(ABC):
     def __init__(
         self,
         table: "Table",
         chunksize: int,
         callback: _Callback | None,
+        background: bool = False,
+        max_pending: int = 4,
     ) -> None:
         self.queue: list[MutableRow] = []
         self.table: Table = table
@@ -27,20 +31,106 @@ class _Chunker:
         if callback and not callable(callback):
             raise InvalidCallbackError
         self.callback: _Callback | None = callback
+        self._pending: queue.Queue[list[MutableRow] | None] | None = None
+        self._writer: threading.Thread | None = None
+        self._error: BaseException | None = None
+        if max_pending < 1:
+            # queue.Queue treats a size below 1 as unbounded.
+            raise DatasetError(f"max_pending must be at least 1: {max_pending}")
+        if background:
+            if table.db._in_memory:
+                raise DatasetError(
+                    "Background writes need a database file: each thread "
+                    "sees a separate in-memory SQLite database."
+                )
+            self._pending = queue.Queue(maxsize=max_pending)
+            self._writer = threading.Thread(target=self._write_pending, daemon=True)
+            self._writer.start()
+
+    @abstractmethod
+    def _write(self, items: list[MutableRow]) -> None:
+        """Write a chunk of rows to the table."""
+
+    @abstractmethod
+    def _prepare(self) -> None:
+        """Process the queued rows before they are written."""
+
+    def _write_pending(self) -> None:
+        assert self._pending is not None
+        try:
+            while True:
+                items = self._pending.get()
+                if items is None:
+                    self._pending.task_done()
+                    return
+                # After a failure, keep draining the queue so that callers
+                # blocked on a full queue are released.
+                if self._error is None:
+                    try:
+                        self._write(items)
+                    except BaseException as exc:
+                        self._error = exc
+                self._pending.task_done()
+        finally:
+            self.table.db._release_connection()
+
+    def _check_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _hand_off(self) -> None:
+        """Write the queued rows, or pass them to the background writer."""
+        self._check_error()
+        self._prepare()
+        items, self.queue = self.queue, []
+        if not items:
+            return
+        if self._pending is None:
+            self._write(items)
+        else:
+            # Blocks while max_pending chunks are waiting to be written.
+            self._pending.put(items)
 
     def flush(self) -> None:
-        self.queue.clear()
+        """Write all queued rows, waiting for the background writer if any."""
+        self._hand_off()
+        if self._pending is not None:
+            self._pending.join()
+            self._check_error()
+
+    def close(self) -> None:
+        """Write all queued rows and stop the background writer, if any."""
+        try:
+            self.flush()
+        finally:
+            self._stop()
+        self._check_error()
+
+    def _stop(self) -> None:
+        if self._writer is not None and self._pending is not None:
+            self._pending.put(None)
+            self._writer.join()
+            self._writer = None
 
     def _queue_add(self, item: WriteRow) -> None:
+        self._check_error()
         self.queue.append(dict(item))
         if len(self.queue) >= self.chunksize:
-            self.flush()
+            self._hand_off()
 
     def __enter__(self) -> "_Chunker":
         return self
 
     def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
-        self.flush()
+        if exc_type is None:
+            self.close()
+            return
+        # Don't mask the original exception with a background write error.
+        try:
+            if self._error is None:
+                self.flush()
+        finally:
+            self._stop()
 
 
 class ChunkedInsert(_Chunker):
@@ -52,6 +142,15 @@ class ChunkedInsert(_Chunker):
     optional callback can be provided that will be called before the insert.
     This callback takes one parameter which is the queue which is about to be
     inserted into the database
+
+    With `background=True`, full chunks are handed to a writer thread, so
+    that producing rows overlaps with writing them. At most `max_pending`
+    chunks wait in memory; beyond that, `insert` blocks until the writer
+    catches up. `flush` waits until all queued rows are written. A failed
+    write is raised from the next `insert`, `flush` or from leaving the
+    context. The writer uses its own connection, so its
+    writes are committed chunk by chunk and are not part of a transaction
+    opened on the calling thread.
     """
 
     def __init__(
@@ -59,22 +158,25 @@ class ChunkedInsert(_Chunker):
         table: "Table",
         chunksize: int = 1000,
         callback: _Callback | None = None,
+        background: bool = False,
+        max_pending: int = 4,
     ) -> None:
         self.fields: set[str] = set()
-        super().__init__(table, chunksize, callback)
+        super().__init__(table, chunksize, callback, background, max_pending)
 
     def insert(self, item: WriteRow) -> None:
         self.fields.update(item.keys())
         super()._queue_add(item)
 
-    def flush(self) -> None:
+    def _prepare(self) -> None:
         for item in self.queue:
             for field in self.fields:
                 item[field] = item.get(field)
         if self.callback is not None:
             self.callback(self.queue)
-        self.table.insert_many(self.queue)
-        super().flush()
+
+    def _write(self, items: list[MutableRow]) -> None:
+        self.table.insert_many(items)
 
 
 class ChunkedUpdate(_Chunker):
@@ -101,10 +203,20 @@ class ChunkedUpdate(_Chunker):
     def update(self, item: WriteRow) -> None:
         super()._queue_add(item)
 
-    def flush(self) -> None:
+    def _prepare(self) -> None:
         if self.callback is not None:
             self.callback(self.queue)
-        self.queue.sort(key=dict.keys)
-        for _fields, items in itertools.groupby(self.queue, key=dict.keys):
-            self.table.update_many(list(items), self.keys)
-        super().flush()
+
+    def _write(self, items: list[MutableRow]) -> None:
+        # Rows are grouped by their set of columns, regardless of key order,
+        # so that each group is written with a single executemany.
+        first = items[0].keys()
+        if all(item.keys() == first for item in items):
+            groups = [items]
+        else:
+            signatures: dict[frozenset[str], list[MutableRow]] = {}
+            for item in items:
+                signatures.setdefault(frozenset(item), []).append(item)
+            groups = list(signatures.values())
+        for group in groups:
+            self.table.update_many(group, self.keys, chunk_size=len(group))
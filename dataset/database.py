@@ -1,20 +1,30 @@
 import logging
 import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from typing import Any, Literal
 from urllib.parse import parse_qs, urlparse
 
 from alembic.migration import MigrationContext
 from alembic.operations import Operations
 from sqlalchemy import Connection, Engine, create_engine, event, inspect
+from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.schema import MetaData
 from sqlalchemy.sql import text
-from sqlalchemy.sql.expression import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
+from dataset.files import Source, csv_options, export_result, file_format
+from dataset.replicas import ReplicaSet
 from dataset.table import Table
 from dataset.types import ColumnType, Types
 from dataset.util import (
     QUERY_STEP,
+    DatasetError,
+    OutRow,
     ResultIter,
     RowFactory,
     normalize_table_name,
@@ -24,6 +34,74 @@ from dataset.util import (
 
 log = logging.getLogger(__name__)
 
+# Changed rows remembered per table until a commit; beyond this many, all
+# cached rows of the table are dropped instead.
+MAX_TRACKED_CHANGES = 1000
+
+# Named sets of SQLite pragmas, see Database.sqlite_profile().
+SQLITE_PROFILES: dict[str, dict[str, str | int]] = {
+    # Fast writes for loading data; a crash or power loss during the load can
+    # leave the database corrupt.
+    "bulk_load": {
+        "synchronous": "OFF",
+        "cache_size": -262144,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    # Read-only connections for serving queries from a finished database.
+    "read_serving": {
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "query_only": "ON",
+    },
+}
+
+
+def _sqlite_pragmas(profile: str) -> dict[str, str | int]:
+    try:
+        return SQLITE_PROFILES[profile]
+    except KeyError:
+        raise DatasetError(f"Unknown SQLite profile: {profile!r}") from None
+
+
+def _pragma(dbapi_con: DBAPIConnection, name: str, value: Any = None) -> Any:
+    cursor = dbapi_con.cursor()
+    try:
+        if value is not None:
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.execute(f"PRAGMA {name}")
+        row = cursor.fetchone()
+        return row[0] if row else None
+    finally:
+        cursor.close()
+
+
+class _Explain(Executable, ClauseElement):
+    """Wrap a statement in the dialect's EXPLAIN prefix."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement, analyze: bool = False) -> None:
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    dialect = compiler.dialect.name
+    if dialect == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    elif dialect == "postgresql" and element.analyze:
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) "
+    elif element.analyze:
+        prefix = "EXPLAIN ANALYZE "
+    else:
+        prefix = "EXPLAIN "
+    sql = compiler.process(element.statement, **kw)
+    # The plan has its own columns, so don't type them like the statement's.
+    compiler._result_columns = []
+    return prefix + sql
+
 
 class Database:
     """A database object represents a SQL database with multiple tables."""
@@ -37,6 +115,10 @@ class Database:
         row_type: RowFactory = row_factory,
         sqlite_wal_mode: bool = True,
         on_connect_statements: list[str] | None = None,
+        sqlite_profile: str | None = None,
+        read_urls: Sequence[str] | None = None,
+        read_strategy: str = "round_robin",
+        read_your_writes: float = 0.0,
     ) -> None:
         """Configure and connect to the database."""
         if engine_kwargs is None:
@@ -65,8 +147,7 @@ class Database:
         self.is_postgres = self.engine.dialect.name == "postgresql"
         self.is_sqlite = self.engine.dialect.name == "sqlite"
         self.is_mysql = "mysql" in self.engine.dialect.name
-        if on_connect_statements is None:
-            on_connect_statements = []
+        on_connect_statements = list(on_connect_statements or [])
 
         def _run_on_connect(dbapi_con: Any, con_record: Any) -> None:
             # reference:
@@ -79,8 +160,23 @@ class Database:
             # we only enable WAL mode for sqlite databases that are not in-memory
             on_connect_statements.append("PRAGMA journal_mode=WAL")
 
+        if sqlite_profile is not None:
+            pragmas = _sqlite_pragmas(sqlite_profile)
+            if self.is_sqlite:
+                on_connect_statements.extend(
+                    f"PRAGMA {name}={value}" for name, value in pragmas.items()
+                )
+
+        self.replicas: ReplicaSet | None = None
+        if read_urls:
+            engines = [create_engine(u, **engine_kwargs) for u in read_urls]
+            self.replicas = ReplicaSet(engines, read_strategy)
+        self.read_your_writes = read_your_writes
+
         if len(on_connect_statements):
             event.listen(self.engine, "connect", _run_on_connect)
+            for engine in self.replicas.engines if self.replicas else []:
+                event.listen(engine, "connect", _run_on_connect)
 
         self.types = Types(is_postgres=self.is_postgres)
         self.url = url
@@ -99,6 +195,13 @@ class Database:
                 self.connections[tid] = self.engine.connect()
             return self.connections[tid]
 
+    @property
+    def _in_memory(self) -> bool:
+        """Check for an in-memory SQLite database, which is private to a thread."""
+        if not self.is_sqlite or self.engine is None:
+            return False
+        return self.engine.url.database in (None, "", ":memory:")
+
     @property
     def op(self) -> Operations:
         """Get an alembic operations context."""
@@ -133,10 +236,53 @@ class Database:
             if conn is not None:
                 conn.close()
 
+    def _read_connection(self) -> Connection | None:
+        """Connect to a replica for a read, or return None to use the primary.
+
+        Reads stay on the primary inside a transaction, and for
+        ``read_your_writes`` seconds after this thread's last write.
+        """
+        if self.replicas is None or self.in_transaction:
+            return None
+        last_write = getattr(self.local, "last_write", None)
+        if (
+            last_write is not None
+            and time.monotonic() - last_write < self.read_your_writes
+        ):
+            return None
+        return self.replicas.connect()
+
     def _flush_tables(self) -> None:
         """Clear the table metadata after transaction rollbacks."""
         for table in self._tables.values():
             table._table = None
+            table._changed()
+
+    def _track_change(
+        self, table: Table, rows: bool, filters: Mapping[str, Any] | None
+    ) -> None:
+        """Remember a change by this thread, to clear the caches on commit.
+
+        ``rows`` tells whether cached rows may have changed, limited to those
+        matching ``filters`` if given.
+        """
+        if not hasattr(self.local, "changes"):
+            self.local.changes = {}
+        changes: dict[Table, list[Mapping[str, Any]] | None] = self.local.changes
+        forget = changes.setdefault(table, [])
+        if not rows or forget is None:
+            return
+        if filters is None or len(forget) >= MAX_TRACKED_CHANGES:
+            changes[table] = None
+        else:
+            forget.append(filters)
+
+    def _committed(self) -> None:
+        """Clear the caches of the tables changed by this thread's commit."""
+        changes = getattr(self.local, "changes", None)
+        self.local.changes = {}
+        for table, forget in (changes or {}).items():
+            table._committed(forget)
 
     def _auto_commit(self) -> None:
         """Commit pending changes when not in an explicit transaction.
@@ -146,8 +292,10 @@ class Database:
         after each write operation when the user has not started an
         explicit transaction via ``begin()``/``with db:``.
         """
+        self.local.last_write = time.monotonic()
         if not self.in_transaction:
             self.executable.commit()
+            self._committed()
 
     def begin(self) -> None:
         """Enter a transaction explicitly.
@@ -177,6 +325,7 @@ class Database:
                 else:
                     self.executable.commit()
                 self._release_connection()
+                self._committed()
 
     def rollback(self) -> None:
         """Roll back the current transaction.
@@ -192,6 +341,41 @@ class Database:
                     self.executable.rollback()
                 self._release_connection()
             self._flush_tables()
+            if not self.local.tx:
+                self.local.changes = {}
+
+    @contextmanager
+    def sqlite_profile(self, profile: str) -> Iterator[None]:
+        """Switch this thread's SQLite connection to a profile for a block.
+
+        The pragmas of the profile are applied on entry and their previous
+        values are restored on exit, so that a large load can run with the
+        ``bulk_load`` settings on a database that is otherwise used with safe
+        defaults. This has no effect on other databases, and can not be used
+        inside a transaction.
+        ::
+
+            with db.sqlite_profile('bulk_load'):
+                table.insert_many(rows)
+        """
+        pragmas = _sqlite_pragmas(profile)
+        if not self.is_sqlite:
+            yield
+            return
+        if self.in_transaction:
+            raise DatasetError("Cannot switch SQLite profiles in a transaction.")
+        conn = self.executable
+        conn.commit()
+        dbapi_con = conn.connection.dbapi_connection
+        assert dbapi_con is not None
+        previous = {name: _pragma(dbapi_con, name) for name in pragmas}
+        for name, value in pragmas.items():
+            _pragma(dbapi_con, name, value)
+        try:
+            yield
+        finally:
+            for name, value in previous.items():
+                _pragma(dbapi_con, name, value)
 
     def __enter__(self) -> "Database":
         """Start a transaction."""
@@ -224,6 +408,8 @@ class Database:
             self.connections.clear()
         if self.engine is not None:
             self.engine.dispose()
+        if self.replicas is not None:
+            self.replicas.dispose()
         self._tables = {}
         self.engine = None
 
@@ -365,17 +551,98 @@ class Database:
                 print(row['user'], row['c'])
 
         The returned iterator will yield each result sequentially.
+
+        If the database has read replicas, pass ``_readonly=True`` for
+        statements that only read, so that they can be sent to a replica.
+        Other statements run on the primary and count as a write for
+        ``read_your_writes``.
         """
         if isinstance(query, str):
             query = text(query)
         _step = kwargs.pop("_step", QUERY_STEP)
         if _step is False or _step == 0:
             _step = None
+        conn = None
+        if kwargs.pop("_readonly", False):
+            conn = self._read_connection()
+        else:
+            self.local.last_write = time.monotonic()
+        if kwargs:
+            rp = (conn or self.executable).execute(query, kwargs)
+        else:
+            rp = (conn or self.executable).execute(query)
+        return ResultIter(rp, row_type=self.row_type, step=_step, connection=conn)
+
+    def explain(
+        self, query: str | Executable, analyze: bool = False, **kwargs: Any
+    ) -> list[OutRow]:
+        """Return the database's query plan for a statement.
+
+        ``query`` and keyword arguments are handled as in
+        :py:meth:`query() <dataset.Database.query>`. SQLite reports its
+        ``EXPLAIN QUERY PLAN`` output; other dialects use ``EXPLAIN``. Setting
+        ``analyze`` runs the statement and reports actual timings
+        (``EXPLAIN (ANALYZE, BUFFERS)`` on PostgreSQL, ``EXPLAIN ANALYZE``
+        on MySQL). It is ignored on SQLite.
+        ::
+
+            for step in db.explain('SELECT * FROM photos WHERE user = :u', u=1):
+                print(step)
+        """
+        if isinstance(query, str):
+            query = text(query)
+        assert isinstance(query, ClauseElement)
+        stmt = _Explain(query, analyze=analyze)
         if kwargs:
-            rp = self.executable.execute(query, kwargs)
+            rp = self.executable.execute(stmt, kwargs)
+        else:
+            rp = self.executable.execute(stmt)
+        return list(ResultIter(rp, row_type=self.row_type))
+
+    def export_query(
+        self, query: str | Executable, target: Source, **kwargs: Any
+    ) -> int:
+        """Write the results of a query to a CSV or JSON lines file.
+
+        ``query`` and keyword arguments for parameter binding are handled as
+        in :py:meth:`query() <dataset.Database.query>`. ``target`` is a path
+        or an open text file. The format is taken from the file name
+        (``.csv``, ``.tsv`` or ``.jsonl``, optionally followed by ``.gz`` or
+        ``.zst`` for compression) unless ``_format`` is given. Options for
+        :py:func:`csv.writer` can be passed as a dict in ``_fmtparams``;
+        ``.tsv`` files are written with tabs unless it sets a ``delimiter``.
+
+        Results are read through a server-side cursor and written in batches
+        of ``_step`` rows, so memory use does not grow with the result size.
+        Progress and throughput are logged; returns the number of rows. Inside
+        a transaction, the export sees the changes made in it.
+        ::
+
+            db.export_query('SELECT * FROM photos WHERE user = :u', 'u.csv', u=1)
+        """
+        format_ = file_format(target, kwargs.pop("_format", None))
+        fmtparams = csv_options(target, kwargs.pop("_fmtparams", None))
+        _step = kwargs.pop("_step", QUERY_STEP)
+        if _step is False or _step == 0:
+            _step = None
+        if isinstance(query, str):
+            query = text(query)
+        if self.engine is None:
+            raise RuntimeError("Database is closed")
+        context: AbstractContextManager[Connection]
+        if self.in_transaction or self._in_memory:
+            # A new connection would not see the transaction, and closing it
+            # would roll back the connection an in-memory database shares.
+            context = nullcontext(self.executable)
         else:
-            rp = self.executable.execute(query)
-        return ResultIter(rp, row_type=self.row_type, step=_step)
+            context = self.engine.connect()
+        options = {"stream_results": True}
+        with context as conn:
+            if kwargs:
+                rp = conn.execute(query, kwargs, execution_options=options)
+            else:
+                rp = conn.execute(query, execution_options=options)
+            return export_result(rp, target, format_, step=_step, **fmtparams)
 
     def __repr__(self) -> str:
         """Text representation contains the URL."""
@@ -0,0 +1,360 @@
+import csv
+import gzip
+import io
+import json
+import logging
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager, suppress
+from datetime import date, datetime
+from itertools import islice
+from os import PathLike, fspath
+from typing import IO, TYPE_CHECKING, Any
+
+from sqlalchemy import Result
+from sqlalchemy.types import JSON, Boolean, Date, DateTime, Float, Integer
+
+from dataset.types import ColumnType, Types
+from dataset.util import QUERY_STEP, DatasetError, MutableRow
+
+if TYPE_CHECKING:
+    from dataset.table import Table
+
+log = logging.getLogger(__name__)
+
+Source = str | PathLike[str] | IO[str]
+Converter = Callable[[str], Any]
+
+
+def open_zstd(path: str, mode: str) -> IO[bytes]:
+    """Open a zstd-compressed file, which needs Python 3.14 or zstandard."""
+    try:
+        from compression import zstd  # type: ignore[import-not-found,unused-ignore]
+
+        return zstd.open(path, mode)  # type: ignore[no-any-return,unused-ignore]
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found,unused-ignore]
+    except ImportError as exc:
+        raise DatasetError(
+            "Reading and writing .zst files requires the zstandard package."
+        ) from exc
+    return zstandard.open(path, mode)  # type: ignore[no-any-return,unused-ignore]
+
+
+@contextmanager
+def open_text(source: Source, mode: str, encoding: str) -> Iterator[IO[str]]:
+    """Open a path, or pass through an open file.
+
+    Paths ending in ``.gz`` or ``.zst`` are compressed with gzip or zstd.
+    """
+    if not isinstance(source, (str, PathLike)):
+        yield source
+        return
+    path = fspath(source)
+    if path.endswith((".gz", ".zst")):
+        if path.endswith(".gz"):
+            raw: IO[bytes] | gzip.GzipFile = gzip.GzipFile(path, mode + "b")
+        else:
+            raw = open_zstd(path, mode + "b")
+        with raw, io.TextIOWrapper(raw, encoding=encoding, newline="") as fh:
+            yield fh
+    else:
+        with open(path, mode, encoding=encoding, newline="") as fh:
+            yield fh
+
+
+def _file_name(source: Source) -> str | None:
+    """The lower-case file name of a path, without a compression suffix."""
+    if not isinstance(source, (str, PathLike)):
+        return None
+    name = fspath(source).lower()
+    for suffix in (".gz", ".zst"):
+        name = name.removesuffix(suffix)
+    return name
+
+
+def file_format(source: Source, format: str | None) -> str:  # noqa: A002
+    """Pick ``csv`` or ``jsonl`` from an explicit format or the file name."""
+    name = _file_name(source)
+    if format is None and name is not None:
+        if name.endswith((".jsonl", ".ndjson")):
+            format = "jsonl"
+        elif name.endswith((".csv", ".tsv", ".txt")):
+            format = "csv"
+    if format not in ("csv", "jsonl"):
+        raise DatasetError(f"Unknown file format: {format!r}")
+    return format
+
+
+def csv_options(target: Source, fmtparams: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Options for :py:func:`csv.writer`, with tabs as delimiter in ``.tsv`` files."""
+    options = dict(fmtparams or {})
+    name = _file_name(target)
+    if name is not None and name.endswith(".tsv"):
+        options.setdefault("delimiter", "\t")
+    return options
+
+
+def check_leading_zero(value: str) -> None:
+    # Keep identifiers such as ZIP codes with leading zeros as text.
+    digits = value.lstrip("+-")
+    if len(digits) > 1 and digits[0] == "0" and digits[1] != ".":
+        raise ValueError(f"Leading zero: {value!r}")
+
+
+def parse_int(value: str) -> int:
+    check_leading_zero(value)
+    return int(value)
+
+
+def parse_float(value: str) -> float:
+    check_leading_zero(value)
+    return float(value)
+
+
+def parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in ("true", "t", "yes"):
+        return True
+    if lowered in ("false", "f", "no"):
+        return False
+    raise ValueError(f"Not a boolean: {value!r}")
+
+
+def converter_for(type_: ColumnType) -> Converter | None:
+    """Find the function that parses a text value into ``type_``."""
+    type_class = type_ if isinstance(type_, type) else type(type_)
+    if issubclass(type_class, Boolean):
+        return parse_bool
+    if issubclass(type_class, Integer):
+        return int
+    if issubclass(type_class, Float):
+        return float
+    if issubclass(type_class, DateTime):
+        return datetime.fromisoformat
+    if issubclass(type_class, Date):
+        return date.fromisoformat
+    if issubclass(type_class, JSON):
+        return json.loads
+    return None
+
+
+def infer_text_types(sample: list[MutableRow], types: Types) -> dict[str, ColumnType]:
+    """Guess column types for rows of text values, as read from a CSV file.
+
+    Each column gets the narrowest of integer, float, date, datetime and
+    boolean that parses all of its non-empty sample values, otherwise text.
+    """
+    parsers: list[tuple[ColumnType, Converter]] = [
+        (types.bigint, parse_int),
+        (types.float, parse_float),
+        (types.date, date.fromisoformat),
+        (types.datetime, datetime.fromisoformat),
+        (types.boolean, parse_bool),
+    ]
+    inferred: dict[str, ColumnType] = {}
+    for column in dict.fromkeys(k for row in sample for k in row):
+        values = [row.get(column) for row in sample]
+        texts = [v for v in values if isinstance(v, str) and v != ""]
+        inferred[column] = types.text
+        if not texts:
+            continue
+        for type_, parse in parsers:
+            try:
+                for text in texts:
+                    parse(text)
+            except ValueError:
+                continue
+            inferred[column] = type_
+            break
+    return inferred
+
+
+def infer_value_types(sample: list[MutableRow], types: Types) -> dict[str, ColumnType]:
+    """Guess column types for rows of JSON values.
+
+    Unlike :py:meth:`Types.guess() <dataset.types.Types.guess>`, this looks at
+    all sample values, so that a column of mixed integers and floats becomes
+    a float column, and lists are stored as JSON.
+    """
+    inferred: dict[str, ColumnType] = {}
+    for column in dict.fromkeys(k for row in sample for k in row):
+        values = [row.get(column) for row in sample]
+        values = [v for v in values if v is not None]
+        if not values:
+            inferred[column] = types.text
+        elif all(isinstance(v, (dict, list)) for v in values):
+            inferred[column] = types.json
+        elif all(isinstance(v, bool) for v in values):
+            inferred[column] = types.boolean
+        elif all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+            inferred[column] = types.bigint
+        elif all(
+            isinstance(v, (int, float)) and not isinstance(v, bool) for v in values
+        ):
+            inferred[column] = types.float
+        else:
+            inferred[column] = types.guess(values[0])
+    return inferred
+
+
+def convert_chunk(
+    chunk: list[MutableRow], converters: dict[str, Converter]
+) -> list[MutableRow]:
+    """Parse text values column by column; empty strings become ``NULL``.
+
+    Values which cannot be parsed are left as they are.
+    """
+    for column, convert in converters.items():
+        for row in chunk:
+            value = row.get(column)
+            if not isinstance(value, str):
+                continue
+            if value == "":
+                row[column] = None
+                continue
+            with suppress(ValueError):
+                row[column] = convert(value)
+    return chunk
+
+
+def load_rows(
+    table: "Table",
+    rows: Iterator[MutableRow],
+    text: bool,
+    chunk_size: int,
+    sample_size: int,
+    types: dict[str, ColumnType] | None,
+    ensure: bool | None,
+) -> int:
+    """Insert a stream of rows in chunks, with types inferred from a sample."""
+    sample = list(islice(rows, sample_size))
+    if text:
+        col_types = infer_text_types(sample, table.db.types)
+    else:
+        col_types = infer_value_types(sample, table.db.types)
+    col_types.update(types or {})
+    converters: dict[str, Converter] = {}
+    if text:
+        for column, type_ in col_types.items():
+            convert = converter_for(type_)
+            if convert is not None:
+                converters[column] = convert
+
+    started = time.perf_counter()
+    total = 0
+
+    def flush(chunk: list[MutableRow]) -> None:
+        nonlocal total
+        chunk = convert_chunk(chunk, converters)
+        table.insert_many(chunk, chunk_size=chunk_size, ensure=ensure, types=col_types)
+        total += len(chunk)
+        elapsed = time.perf_counter() - started
+        log.info(
+            "Loaded %d rows into %s (%.0f rows/s)",
+            total,
+            table.name,
+            total / elapsed if elapsed else 0.0,
+        )
+
+    for offset in range(0, len(sample), chunk_size):
+        flush(sample[offset : offset + chunk_size])
+    del sample
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        flush(chunk)
+    return total
+
+
+def read_csv(fh: IO[str], **fmtparams: Any) -> Iterator[MutableRow]:
+    for row in csv.DictReader(fh, **fmtparams):
+        # Short rows fill missing columns with None, long rows add a None key.
+        row.pop(None, None)
+        yield dict(row)
+
+
+def read_jsonl(fh: IO[str]) -> Iterator[MutableRow]:
+    for line in fh:
+        if line.strip():
+            yield json.loads(line)
+
+
+def json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def export_result(
+    rp: Result[Any],
+    target: Source,
+    format: str,  # noqa: A002
+    step: int | None = QUERY_STEP,
+    encoding: str = "utf-8",
+    **fmtparams: Any,
+) -> int:
+    """Write a query result to a CSV or JSON lines file, batch by batch.
+
+    Rows are written straight from the result tuples. In CSV files, JSON
+    values are written as JSON text and ``NULL`` as an empty field; extra
+    keyword arguments are passed to :py:func:`csv.writer`.
+    """
+    keys = list(rp.keys())
+    started = time.perf_counter()
+    total = 0
+    # Columns whose values still need to be checked for JSON data.
+    unknown = set(range(len(keys)))
+    json_columns: list[int] = []
+    # For JSON lines, encode each key once; like a dict, a duplicate key keeps
+    # its first place and the last value.
+    positions: dict[str, int] = {}
+    for index, key in enumerate(keys):
+        positions[key] = index
+    fields = [(json.dumps(key) + ": ", index) for key, index in positions.items()]
+    with open_text(target, "w", encoding) as fh:
+        writer = csv.writer(fh, **fmtparams) if format == "csv" else None
+        if writer is not None:
+            writer.writerow(keys)
+        while True:
+            batch = rp.fetchall() if step is None else rp.fetchmany(step)
+            if not batch:
+                break
+            if writer is None:
+                fh.writelines(
+                    "{"
+                    + ", ".join(
+                        prefix + json.dumps(row[index], default=json_default)
+                        for prefix, index in fields
+                    )
+                    + "}\n"
+                    for row in batch
+                )
+            else:
+                for index in list(unknown):
+                    for row in batch:
+                        if row[index] is not None:
+                            unknown.discard(index)
+                            if isinstance(row[index], (dict, list)):
+                                json_columns.append(index)
+                            break
+                if json_columns:
+                    rows: list[Any] = [list(row) for row in batch]
+                    for row in rows:
+                        for index in json_columns:
+                            row[index] = json.dumps(row[index], default=json_default)
+                    writer.writerows(rows)
+                else:
+                    writer.writerows(batch)
+            total += len(batch)
+            elapsed = time.perf_counter() - started
+            log.info(
+                "Exported %d rows (%.0f rows/s)",
+                total,
+                total / elapsed if elapsed else 0.0,
+            )
+    rp.close()
+    return total
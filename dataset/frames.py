@@ -0,0 +1,276 @@
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy.types import Boolean, Date, DateTime, Float, Integer, TypeEngine
+
+from dataset.types import ColumnType, Types
+from dataset.util import DatasetError
+
+Batch = Sequence[Sequence[Any]]
+
+# The numpy dtype of each kind of column; other values are kept as objects.
+DTYPES = {
+    "bool": "bool",
+    "int": "int64",
+    "float": "float64",
+    "datetime": "datetime64[us]",
+    "date": "datetime64[D]",
+    "object": "object",
+}
+
+
+def import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise DatasetError("Building arrays requires the numpy package.") from exc
+    return numpy
+
+
+def import_pandas() -> Any:
+    try:
+        import pandas  # type: ignore[import-untyped,unused-ignore]
+    except ImportError as exc:
+        raise DatasetError("Building data frames requires pandas.") from exc
+    return pandas
+
+
+def _kind(type_: TypeEngine[Any] | None) -> str | None:
+    """Pick the kind of array for a column type, ``None`` if unknown."""
+    if type_ is None:
+        return None
+    if isinstance(type_, Boolean):
+        return "bool"
+    if isinstance(type_, Integer):
+        return "int"
+    if isinstance(type_, Float):
+        return "float"
+    if isinstance(type_, DateTime):
+        return "object" if type_.timezone else "datetime"
+    if isinstance(type_, Date):
+        return "date"
+    return "object"
+
+
+def _infer(values: Sequence[Any]) -> str:
+    """Pick the kind of array from the first value that is not ``NULL``."""
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            return "bool"
+        if isinstance(value, int):
+            return "int"
+        if isinstance(value, float):
+            return "float"
+        if isinstance(value, datetime):
+            return "object" if value.tzinfo is not None else "datetime"
+        if isinstance(value, date):
+            return "date"
+        break
+    return "object"
+
+
+def _convert(np: Any, kind: str, values: Sequence[Any]) -> tuple[Any, Any | None]:
+    """Build the array for one batch of a column, and a mask of its ``NULL``s.
+
+    Raises ``TypeError`` if a value does not fit the kind of column.
+    """
+    if kind == "object":
+        return np.fromiter(values, dtype=object, count=len(values)), None
+    if kind in ("datetime", "date"):
+        # numpy would parse strings and drop time zones, so check the types.
+        expected = datetime if kind == "datetime" else date
+        for value in values:
+            if value is not None and (
+                type(value) is not expected or getattr(value, "tzinfo", None)
+            ):
+                raise TypeError(f"Unexpected {type(value)} value")
+        return np.array(values, dtype=DTYPES[kind]), None
+    mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    if mask.any():
+        fill = {"bool": False, "int": 0, "float": float("nan")}[kind]
+        values = [fill if v is None else v for v in values]
+    else:
+        mask = None
+    array = np.array(values)
+    if array.dtype.kind not in {"bool": "b", "int": "iu", "float": "fiu"}[kind]:
+        raise TypeError(f"Unexpected {array.dtype} values")
+    if kind == "float":
+        return array.astype("float64", copy=False), None
+    return array, mask
+
+
+class _Column:
+    """Turns batches of values from one result column into arrays."""
+
+    def __init__(self, np: Any, type_: TypeEngine[Any] | None) -> None:
+        self.np = np
+        self.kind = _kind(type_)
+
+    def add(self, values: Sequence[Any]) -> tuple[Any, Any | None]:
+        if self.kind is None:
+            self.kind = _infer(values)
+        try:
+            return _convert(self.np, self.kind, values)
+        except (TypeError, ValueError, OverflowError):
+            # A value that doesn't fit the column type, e.g. text stored in an
+            # integer column by SQLite: keep this and later batches as objects.
+            self.kind = "object"
+            return _convert(self.np, self.kind, values)
+
+    def empty(self) -> Any:
+        return self.np.empty(0, dtype=DTYPES[self.kind or "object"])
+
+
+def _as_object(array: Any, mask: Any | None) -> Any:
+    array = array.astype(object)
+    if mask is not None:
+        array[mask] = None
+    return array
+
+
+def _arrays(
+    columns: Sequence[_Column], batches: Iterable[Batch]
+) -> Iterator[list[tuple[Any, Any | None]]]:
+    for batch in batches:
+        if batch:
+            yield [
+                column.add(values)
+                for column, values in zip(
+                    columns, zip(*batch, strict=True), strict=True
+                )
+            ]
+
+
+def to_numpy(
+    keys: Sequence[str],
+    types: Sequence[TypeEngine[Any] | None],
+    batches: Iterable[Batch],
+) -> dict[str, Any]:
+    """Build one array per column from batches of result tuples.
+
+    Columns with ``NULL`` values in an integer or boolean column are
+    returned as ``numpy.ma.MaskedArray``; ``NULL`` is ``NaN`` in float
+    columns and ``NaT`` in date and time columns.
+    """
+    np = import_numpy()
+    columns = [_Column(np, type_) for type_ in types]
+    parts: list[list[tuple[Any, Any | None]]] = [[] for _ in keys]
+    for arrays in _arrays(columns, batches):
+        for column, part in zip(parts, arrays, strict=True):
+            column.append(part)
+    result: dict[str, Any] = {}
+    for key, builder, column in zip(keys, columns, parts, strict=True):
+        if not column:
+            result[key] = builder.empty()
+            continue
+        dtypes = {array.dtype for array, _ in column}
+        if len(dtypes) > 1:
+            column = [(_as_object(array, mask), None) for array, mask in column]
+        data = np.concatenate([array for array, _ in column])
+        if any(mask is not None for _, mask in column):
+            mask = np.concatenate(
+                [
+                    np.zeros(len(array), dtype=bool) if mask is None else mask
+                    for array, mask in column
+                ]
+            )
+            data = np.ma.MaskedArray(data, mask=mask)
+        result[key] = data
+    return result
+
+
+def _frame(pd: Any, keys: Sequence[str], arrays: Sequence[tuple[Any, Any]]) -> Any:
+    data = {}
+    for key, (array, mask) in zip(keys, arrays, strict=True):
+        if mask is not None:
+            if array.dtype.kind == "b":
+                array = pd.arrays.BooleanArray(array, mask)
+            else:
+                array = pd.arrays.IntegerArray(array, mask)
+        data[key] = array
+    return pd.DataFrame(data, columns=list(keys))
+
+
+def to_pandas(
+    keys: Sequence[str],
+    types: Sequence[TypeEngine[Any] | None],
+    batches: Iterable[Batch],
+) -> Any:
+    """Build a ``pandas.DataFrame`` from batches of result tuples."""
+    pd = import_pandas()
+    np = import_numpy()
+    columns = to_numpy(keys, types, batches)
+    arrays = []
+    for array in columns.values():
+        if isinstance(array, np.ma.MaskedArray):
+            arrays.append((array.data, array.mask))
+        else:
+            arrays.append((array, None))
+    return _frame(pd, list(columns), arrays)
+
+
+def iter_dataframes(
+    keys: Sequence[str],
+    types: Sequence[TypeEngine[Any] | None],
+    batches: Iterable[Batch],
+) -> Iterator[Any]:
+    """Yield a ``pandas.DataFrame`` for each batch of result tuples."""
+    pd = import_pandas()
+    np = import_numpy()
+    columns = [_Column(np, type_) for type_ in types]
+    for arrays in _arrays(columns, batches):
+        yield _frame(pd, keys, arrays)
+
+
+def dataframe_types(df: Any, types: Types) -> dict[str, ColumnType]:
+    """Choose a column type for each column of a ``pandas.DataFrame``.
+
+    Types follow the dtypes; object columns are typed by their first value
+    that is not missing, like :py:meth:`Types.guess`.
+    """
+    result: dict[str, ColumnType] = {}
+    for name, series in df.items():
+        dtype = series.dtype
+        if dtype.kind == "b":
+            type_: ColumnType = types.boolean
+        elif dtype.kind in "iu":
+            type_ = types.bigint
+        elif dtype.kind == "f":
+            type_ = types.float
+        elif dtype.kind == "M":
+            has_tz = getattr(dtype, "tz", None) is not None
+            type_ = DateTime(timezone=True) if has_tz else types.datetime
+        else:
+            values = series.dropna()
+            type_ = types.guess(values.iloc[0] if len(values) else None)
+        result[str(name)] = type_
+    return result
+
+
+def _python_values(series: Any) -> list[Any]:
+    """Convert a column to Python values, with ``None`` for NaN, NaT or NA."""
+    dtype = series.dtype
+    if dtype.kind == "M":
+        if getattr(dtype, "tz", None) is None:
+            # numpy turns datetime64[us] into datetime objects, and NaT into None.
+            values: list[Any] = series.to_numpy(dtype="datetime64[us]").tolist()
+            return values
+        mask = series.isna().to_numpy()
+        return [
+            None if missing else value
+            for value, missing in zip(series.dt.to_pydatetime(), mask, strict=True)
+        ]
+    values = series.to_numpy(dtype=object, na_value=None).tolist()
+    return values
+
+
+def dataframe_chunks(
+    df: Any, positions: Sequence[int], chunk_size: int
+) -> Iterator[list[list[Any]]]:
+    """Yield chunks of a ``pandas.DataFrame`` as lists of column values."""
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start : start + chunk_size]
+        yield [_python_values(chunk.iloc[:, position]) for position in positions]
@@ -0,0 +1,130 @@
+import logging
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any
+
+from dataset.database import Database
+from dataset.table import Table
+from dataset.types import ColumnType
+from dataset.util import WriteRow
+
+log = logging.getLogger(__name__)
+
+Parser = Callable[[Any], WriteRow]
+
+# The table each worker process writes to, opened lazily by _init_worker.
+_worker_table: Table | None = None
+
+
+def _init_worker(url: str, table_name: str) -> None:
+    global _worker_table
+    _worker_table = Database(url, ensure_schema=False).load_table(table_name)
+
+
+def _parse_chunk(parse: Parser | None, items: list[Any]) -> list[WriteRow]:
+    if parse is None:
+        return items
+    return [parse(item) for item in items]
+
+
+def _write_chunk(parse: Parser | None, items: list[Any]) -> int:
+    assert _worker_table is not None, "worker was not initialised"
+    rows = _parse_chunk(parse, items)
+    _worker_table.insert_many(rows, chunk_size=len(rows) or 1, ensure=False)
+    return len(rows)
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parallel_insert(
+    url: str,
+    table_name: str,
+    items: Iterable[Any],
+    parse: Parser | None = None,
+    processes: int | None = None,
+    chunk_size: int = 1000,
+    types: dict[str, ColumnType] | None = None,
+    single_writer: bool | None = None,
+) -> int:
+    """Parse and insert ``items`` into a table using a pool of processes.
+
+    ``items`` is consumed in chunks of ``chunk_size``, and each chunk is
+    turned into rows by calling ``parse`` on every item in a worker process
+    (if ``parse`` is ``None``, the items must already be row dicts). Both
+    ``parse`` and the items must be picklable, so ``parse`` has to be a
+    module-level function.
+
+    The table and its columns are created once, from the first chunk and
+    ``types``, before any worker starts writing: columns that first appear
+    in later rows must be declared in ``types`` or they are dropped. Each
+    worker then opens its own connection to ``url`` and inserts the chunks it
+    parsed. SQLite allows only one writer at a time, so for SQLite URLs (or
+    when ``single_writer`` is set) the workers only parse and this process
+    writes all chunks. At most two chunks per process are in flight, which
+    bounds memory use.
+
+    Returns the number of inserted rows.
+    ::
+
+        from dataset.parallel import parallel_insert
+
+        def parse(line):
+            return json.loads(line)
+
+        with open('events.jsonl') as fh:
+            parallel_insert('postgresql:///events', 'events', fh, parse)
+    """
+    processes = processes or os.cpu_count() or 1
+    chunks = _chunks(items, chunk_size)
+    first = next(chunks, None)
+    if first is None:
+        return 0
+
+    db = Database(url)
+    try:
+        table = db.get_table(table_name)
+        rows = _parse_chunk(parse, first)
+        table.insert_many(rows, chunk_size=chunk_size, types=types)
+        for name, type_ in (types or {}).items():
+            table.create_column(name, type_)
+        total = len(rows)
+        if single_writer is None:
+            single_writer = db.is_sqlite
+
+        pending: deque[Future[Any]] = deque()
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(url, table.name),
+        ) as pool:
+
+            def collect(future: Future[Any]) -> int:
+                if single_writer:
+                    rows = future.result()
+                    table.insert_many(rows, chunk_size=chunk_size, ensure=False)
+                    return len(rows)
+                count: int = future.result()
+                return count
+
+            for chunk in chunks:
+                if len(pending) >= processes * 2:
+                    total += collect(pending.popleft())
+                    log.info("Inserted %d rows into %s", total, table.name)
+                func = _parse_chunk if single_writer else _write_chunk
+                pending.append(pool.submit(func, parse, chunk))
+            while pending:
+                total += collect(pending.popleft())
+        log.info("Inserted %d rows into %s", total, table.name)
+        return total
+    finally:
+        db.close()
@@ -0,0 +1,90 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Select, and_, bindparam, select
+from sqlalchemy.schema import Table as SQLATable
+
+from dataset.util import DatasetError, OutRow, QueryError, convert_row, ensure_strings
+
+if TYPE_CHECKING:
+    from dataset.table import Table
+
+
+class PreparedLookup:
+    """Repeated equality lookups on a fixed set of columns.
+
+    Created by :py:meth:`Table.prepared_lookup()
+    <dataset.Table.prepared_lookup>`. The ``SELECT`` statement is built once
+    and re-executed with new parameter values, so SQLAlchemy compiles it only
+    once and drivers that prepare repeated statements on the server (such as
+    psycopg 3 and asyncpg) can reuse the query plan. Rows are fetched without
+    a :py:class:`ResultIter <dataset.util.ResultIter>`.
+
+    Values are passed positionally, in the order of ``columns``. Since the
+    lookup uses ``=``, a ``None`` value never matches. Unlike ``find``, the
+    lookups are not recorded by the index advisor or served from the result
+    cache.
+    """
+
+    def __init__(self, table: "Table", columns: str | Sequence[str]) -> None:
+        if not table.exists:
+            raise DatasetError(f"Table does not exist: {table.name}")
+        self.table = table
+        self.columns = [table._get_column_name(c) for c in ensure_strings(columns)]
+        if not self.columns:
+            raise QueryError("A prepared lookup needs at least one column.")
+        self._source: SQLATable | None = None
+        self._width = 0
+        self._select: Select[Any] = select()
+        self._select_one: Select[Any] = select()
+        self._prepare()
+
+    def _prepare(self) -> None:
+        source = self.table.table
+        for column in self.columns:
+            if column not in source.c:
+                raise QueryError(f"No such column: {column}")
+        clause = and_(
+            *[
+                source.c[column] == bindparam(f"p{index}")
+                for index, column in enumerate(self.columns)
+            ]
+        )
+        self._select = select(source).where(clause)
+        self._select_one = self._select.limit(1)
+        self._source = source
+        self._width = len(source.c)
+
+    def _execute(self, one: bool, values: tuple[Any, ...]) -> list[OutRow]:
+        if len(values) != len(self.columns):
+            raise QueryError(
+                f"Expected {len(self.columns)} values for {self.columns}, "
+                f"got {len(values)}."
+            )
+        # Rebuild the statement after the table was re-created or altered.
+        source = self.table._table
+        if source is not self._source or source is None or len(source.c) != self._width:
+            self._prepare()
+        params = {f"p{index}": value for index, value in enumerate(values)}
+        db = self.table.db
+        conn = db._read_connection()
+        try:
+            executable = conn or db.executable
+            if one:
+                row = executable.execute(self._select_one, params).first()
+                rows = [] if row is None else [row]
+            else:
+                rows = list(executable.execute(self._select, params).all())
+        finally:
+            if conn is not None:
+                conn.close()
+        return [convert_row(db.row_type, row) for row in rows]
+
+    def __call__(self, *values: Any) -> OutRow | None:
+        """Return the first row matching ``values``, or ``None``."""
+        rows = self._execute(True, values)
+        return rows[0] if rows else None
+
+    def all(self, *values: Any) -> list[OutRow]:
+        """Return all rows matching ``values``."""
+        return self._execute(False, values)
@@ -0,0 +1,61 @@
+import threading
+from typing import Any
+
+from sqlalchemy import Connection, Engine, event
+
+from dataset.util import DatasetError
+
+STRATEGIES = ("round_robin", "least_loaded")
+
+
+class ReplicaSet:
+    """A group of read replica engines and the policy used to pick one.
+
+    With the ``round_robin`` strategy, reads are spread evenly over the
+    replicas. ``least_loaded`` picks the replica with the fewest connections
+    currently checked out of its pool, taking turns between equally loaded
+    ones. ``reads`` counts the reads routed to each replica.
+    """
+
+    def __init__(self, engines: list[Engine], strategy: str = "round_robin") -> None:
+        if strategy not in STRATEGIES:
+            raise DatasetError(f"Unknown replica strategy: {strategy!r}")
+        self.engines = engines
+        self.strategy = strategy
+        self.active = [0] * len(engines)
+        self.reads = [0] * len(engines)
+        self._next = 0
+        self._lock = threading.Lock()
+        for index, engine in enumerate(engines):
+            self._track(index, engine)
+
+    def _track(self, index: int, engine: Engine) -> None:
+        def checkout(*args: Any) -> None:
+            with self._lock:
+                self.active[index] += 1
+
+        def checkin(*args: Any) -> None:
+            with self._lock:
+                self.active[index] -= 1
+
+        event.listen(engine, "checkout", checkout)
+        event.listen(engine, "checkin", checkin)
+
+    def pick(self) -> Engine:
+        """Choose the engine for the next read."""
+        with self._lock:
+            count = len(self.engines)
+            index = self._next
+            if self.strategy == "least_loaded":
+                order = [(index + offset) % count for offset in range(count)]
+                index = min(order, key=self.active.__getitem__)
+            self._next = (index + 1) % count
+            self.reads[index] += 1
+            return self.engines[index]
+
+    def connect(self) -> Connection:
+        return self.pick().connect()
+
+    def dispose(self) -> None:
+        for engine in self.engines:
+            engine.dispose()
@@ -0,0 +1,319 @@
+import heapq
+import zlib
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from sqlalchemy.sql.expression import ColumnElement
+
+from dataset.types import ColumnType
+from dataset.util import (
+    DatasetError,
+    OutRow,
+    QueryError,
+    SQLWriteValue,
+    WriteRow,
+    ensure_strings,
+)
+
+if TYPE_CHECKING:
+    from dataset.database import Database
+    from dataset.table import Table
+
+T = TypeVar("T")
+ShardKey = Callable[[WriteRow], int]
+
+
+def hash_shard_key(column: str) -> ShardKey:
+    """Assign rows to shards by a stable hash of the value of ``column``."""
+
+    def shard_key(row: WriteRow) -> int:
+        if column not in row:
+            raise KeyError(column)
+        return zlib.crc32(repr(row[column]).encode("utf-8"))
+
+    return shard_key
+
+
+class _SortValue:
+    """A value in a merge key, ordered like the database orders it."""
+
+    __slots__ = ("descending", "nulls_last", "value")
+
+    def __init__(self, value: Any, descending: bool, nulls_last: bool) -> None:
+        self.value = value
+        self.descending = descending
+        self.nulls_last = nulls_last
+
+    def _before(self, a: Any, b: Any) -> bool:
+        if a is None:
+            return b is not None and not self.nulls_last
+        if b is None:
+            return self.nulls_last
+        return bool(a < b)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _SortValue) and bool(self.value == other.value)
+
+    def __lt__(self, other: "_SortValue") -> bool:
+        if self.descending:
+            return self._before(other.value, self.value)
+        return self._before(self.value, other.value)
+
+
+class ShardedTable:
+    """One logical table split over several databases.
+
+    Each row is stored in the shard picked by ``shard_key``: either the name
+    of a column, whose values are hashed, or a function that returns a shard
+    number for a row (taken modulo the number of shards). The shard key
+    should be a natural key of the data, since auto-incremented ids are only
+    unique within a shard.
+
+    Writes are grouped by shard and run on all shards at once, in a thread
+    pool. Reads run on every shard and the results are merged: ``find``
+    applies ``order_by``, ``_limit`` and ``_offset`` across all shards.
+    Each worker thread uses and releases its own connections, so the writes
+    are committed shard by shard and are not part of a transaction opened on
+    the calling thread. In-memory SQLite shards, which are private to a
+    thread, are always queried from the calling thread.
+    ::
+
+        shards = [dataset.connect(f'sqlite:///events-{i}.db') for i in range(4)]
+        events = ShardedTable(shards, 'events', shard_key='user_id')
+        events.insert_many(rows)
+        latest = events.find(user_id=42, order_by='-created', _limit=10)
+    """
+
+    def __init__(
+        self,
+        databases: Sequence["Database"],
+        table_name: str,
+        shard_key: str | ShardKey,
+        primary_id: str | Literal[False] | None = None,
+        primary_type: ColumnType | None = None,
+        primary_increment: bool | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        if not databases:
+            raise DatasetError("A sharded table needs at least one database.")
+        self.shards: list[Table] = [
+            db.get_table(table_name, primary_id, primary_type, primary_increment)
+            for db in databases
+        ]
+        # The column the shard key is computed from, if known.
+        self.shard_column: str | None = None
+        if isinstance(shard_key, str):
+            self.shard_column = shard_key
+            shard_key = hash_shard_key(shard_key)
+        self.shard_key: ShardKey = shard_key
+        self.max_workers = max_workers or len(self.shards)
+        self._parallel = not any(db._in_memory for db in databases)
+
+    def shard_for(self, row: WriteRow) -> "Table":
+        """Return the shard a row is stored in."""
+        return self.shards[self.shard_key(row) % len(self.shards)]
+
+    def _run(self, calls: Sequence[tuple["Table", Callable[[], T]]]) -> list[T]:
+        """Make calls against shards, in parallel where possible."""
+        if not self._parallel or len(calls) < 2:
+            return [func() for _, func in calls]
+
+        def call(shard: "Table", func: Callable[[], T]) -> T:
+            try:
+                return func()
+            finally:
+                shard.db._release_connection()
+
+        workers = min(len(calls), self.max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(call, *zip(*calls, strict=True)))
+
+    def _each(self, method: str, *args: Any, **kwargs: Any) -> list[Any]:
+        """Call a ``Table`` method with the same arguments on every shard."""
+        return self._run(
+            [(s, partial(getattr(s, method), *args, **kwargs)) for s in self.shards]
+        )
+
+    def _partition(
+        self, rows: Sequence[WriteRow]
+    ) -> list[tuple["Table", list[WriteRow]]]:
+        groups: dict[int, list[WriteRow]] = {}
+        for row in rows:
+            groups.setdefault(self.shard_key(row) % len(self.shards), []).append(row)
+        return [(self.shards[index], group) for index, group in groups.items()]
+
+    def insert(
+        self,
+        row: WriteRow,
+        ensure: bool | None = None,
+        types: dict[str, ColumnType] | None = None,
+    ) -> Any:
+        """Insert a row into its shard, see :py:meth:`Table.insert()
+        <dataset.Table.insert>`."""
+        return self.shard_for(row).insert(row, ensure=ensure, types=types)
+
+    def insert_many(
+        self,
+        rows: Sequence[WriteRow],
+        chunk_size: int = 1000,
+        ensure: bool | None = None,
+        types: dict[str, ColumnType] | None = None,
+    ) -> None:
+        """Insert rows into their shards, writing to all shards at once."""
+        self._run(
+            [
+                (shard, partial(shard.insert_many, group, chunk_size, ensure, types))
+                for shard, group in self._partition(rows)
+            ]
+        )
+
+    def upsert(
+        self,
+        row: WriteRow,
+        keys: Sequence[str],
+        ensure: bool | None = None,
+        types: dict[str, ColumnType] | None = None,
+    ) -> Any:
+        """Upsert a row in its shard, see :py:meth:`Table.upsert()
+        <dataset.Table.upsert>`."""
+        return self.shard_for(row).upsert(row, keys, ensure=ensure, types=types)
+
+    def upsert_many(
+        self,
+        rows: Sequence[WriteRow],
+        keys: Sequence[str],
+        chunk_size: int = 1000,
+        ensure: bool | None = None,
+        types: dict[str, ColumnType] | None = None,
+    ) -> None:
+        """Upsert rows in their shards, writing to all shards at once."""
+        self._run(
+            [
+                (
+                    shard,
+                    partial(shard.upsert_many, group, keys, chunk_size, ensure, types),
+                )
+                for shard, group in self._partition(rows)
+            ]
+        )
+
+    def update(
+        self,
+        row: WriteRow,
+        keys: Sequence[str],
+        ensure: bool | None = None,
+        types: dict[str, ColumnType] | None = None,
+    ) -> int:
+        """Update matching rows and return how many were changed.
+
+        If the shard key column is one of ``keys``, only the shard of the
+        matching rows is updated; otherwise, and always with a shard key
+        function, the update is sent to all shards. Rows stay in their
+        shard, so changing the value of the shard key is not supported.
+        """
+        shards = self.shards
+        if self.shard_column is not None and self.shard_column in ensure_strings(keys):
+            shards = [self.shard_for(row)]
+        counts = self._run(
+            [
+                (
+                    shard,
+                    partial(shard.update, row, keys, ensure, types, return_count=True),
+                )
+                for shard in shards
+            ]
+        )
+        return sum(int(count) for count in counts)
+
+    def delete(self, *clauses: ColumnElement[bool], **filters: SQLWriteValue) -> bool:
+        """Delete matching rows from all shards."""
+        return any(self._each("delete", *clauses, **filters))
+
+    def find(
+        self,
+        *_clauses: ColumnElement[bool],
+        _limit: int | None = None,
+        _offset: int = 0,
+        order_by: str | Sequence[str] | None = None,
+        _columns: str | Sequence[str] | None = None,
+        **kwargs: SQLWriteValue,
+    ) -> Iterator[OutRow]:
+        """Search all shards, see :py:meth:`Table.find() <dataset.Table.find>`.
+
+        Each shard returns at most ``_offset + _limit`` rows, which are
+        fetched into memory and merged. With ``order_by``, the rows are
+        merged in that order; otherwise they are returned shard by shard.
+        Only column names can be used for ``order_by``.
+        """
+        stop = None if _limit is None else _offset + _limit
+        key = None if order_by is None else self._sort_key(order_by)
+
+        def query(shard: "Table") -> list[OutRow]:
+            rows = shard.find(
+                *_clauses,
+                _limit=stop,
+                order_by=order_by,
+                _step=None,
+                _columns=_columns,
+                **kwargs,  # type: ignore[arg-type]
+            )
+            return list(rows)
+
+        results = self._run([(shard, partial(query, shard)) for shard in self.shards])
+        rows: Iterator[OutRow]
+        if key is None:
+            rows = chain.from_iterable(results)
+        else:
+            rows = heapq.merge(*results, key=key)
+        return islice(rows, _offset, stop)
+
+    def _sort_key(
+        self, order_by: str | Sequence[str]
+    ) -> Callable[[OutRow], tuple[_SortValue, ...]]:
+        fields = []
+        for ordering in ensure_strings(order_by):
+            if not isinstance(ordering, str):
+                raise QueryError("Sharded tables can only be ordered by column.")
+            fields.append((ordering.lstrip("-"), ordering.startswith("-")))
+        # PostgreSQL sorts NULL after all values, SQLite and MySQL before.
+        nulls_last = self.shards[0].db.is_postgres
+
+        def key(row: OutRow) -> tuple[_SortValue, ...]:
+            return tuple(
+                _SortValue(row.get(name), descending, nulls_last)
+                for name, descending in fields
+            )
+
+        return key
+
+    def find_one(self, *args: ColumnElement[bool], **kwargs: Any) -> OutRow | None:
+        """Get a single result from all shards, or ``None``."""
+        for row in self.find(*args, _limit=1, **kwargs):
+            return row
+        return None
+
+    def count(self, *_clauses: ColumnElement[bool], **kwargs: SQLWriteValue) -> int:
+        """Count the matching rows of all shards."""
+        return sum(self._each("count", *_clauses, **kwargs))
+
+    def create_index(self, columns: Sequence[str], name: str | None = None) -> None:
+        """Create an index on every shard."""
+        self._each("create_index", columns, name=name)
+
+    def drop(self) -> None:
+        """Drop the table from every shard."""
+        self._each("drop")
+
+    def __len__(self) -> int:
+        """Return the number of rows in all shards."""
+        return self.count()
+
+    def __iter__(self) -> Iterator[OutRow]:
+        """Return all rows of all shards, shard by shard."""
+        return chain.from_iterable(self.shards)
+
+    def __repr__(self) -> str:
+        return f"<ShardedTable({self.shards[0].name}, {len(self.shards)} shards)>"
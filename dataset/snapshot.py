@@ -0,0 +1,272 @@
+from array import array
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy.types import Boolean, Float, Integer, TypeEngine
+
+from dataset.util import OutRow, QueryError, RowFactory, ensure_strings
+
+Key = tuple[str, ...]
+
+
+def _equal(a: Any, b: Any) -> bool:
+    """Compare values, without matching booleans to the numbers 0 and 1."""
+    return bool(a == b) and isinstance(a, bool) == isinstance(b, bool)
+
+
+def _hashed(value: Any) -> Any:
+    """The key of a value in a hash index, keeping booleans apart."""
+    return (bool, value) if isinstance(value, bool) else value
+
+
+class _Column:
+    """Values of one column, stored in a Python list."""
+
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+
+    def append(self, value: Any) -> None:
+        self.values.append(value)
+
+    def get(self, index: int) -> Any:
+        return self.values[index]
+
+    def find(self, value: Any) -> Iterator[int]:
+        return (i for i, v in enumerate(self.values) if _equal(v, value))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class _ArrayColumn(_Column):
+    """Numbers in a typed array, with a mask for ``NULL`` values."""
+
+    def __init__(self, typecode: str, convert: type, accepts: tuple[type, ...]) -> None:
+        self.data = array(typecode)
+        self.convert = convert
+        self.accepts = accepts
+        # Only allocated once the first NULL is seen.
+        self.nulls: bytearray | None = None
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            if self.nulls is None:
+                self.nulls = bytearray(len(self.data))
+            self.nulls.append(1)
+            self.data.append(0)
+            return
+        if type(value) not in self.accepts:
+            raise TypeError(f"Unexpected {type(value)} value")
+        self.data.append(value)
+        if self.nulls is not None:
+            self.nulls.append(0)
+
+    def get(self, index: int) -> Any:
+        if self.nulls is not None and self.nulls[index]:
+            return None
+        return self.convert(self.data[index])
+
+    def find(self, value: Any) -> Iterator[int]:
+        if value is None:
+            if self.nulls is None:
+                return iter(())
+            return (i for i, null in enumerate(self.nulls) if null)
+        if type(value) not in self.accepts:
+            return iter(())
+        return (
+            i
+            for i, v in enumerate(self.data)
+            if v == value and (self.nulls is None or not self.nulls[i])
+        )
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+def _code_key(value: Any) -> Hashable:
+    """Tell apart values that compare equal, like ``1``, ``1.0`` and ``True``
+    or ``Decimal('1')`` and ``Decimal('1.00')``."""
+    if isinstance(value, Decimal):
+        return Decimal, value.as_tuple()
+    return type(value), value
+
+
+class _DictColumn(_Column):
+    """Dictionary-encoded values: each distinct value is stored once."""
+
+    def __init__(self) -> None:
+        self.codes = array("i")
+        self.values: list[Any] = []
+        self.lookup: dict[Hashable, int] = {}
+
+    def append(self, value: Any) -> None:
+        key = _code_key(value)
+        code = self.lookup.get(key)
+        if code is None:
+            code = len(self.values)
+            self.lookup[key] = code
+            self.values.append(value)
+        self.codes.append(code)
+
+    def get(self, index: int) -> Any:
+        return self.values[self.codes[index]]
+
+    def find(self, value: Any) -> Iterator[int]:
+        # Equal values of other types, like 1 and 1.0, have their own codes.
+        codes = {c for c, v in enumerate(self.values) if _equal(v, value)}
+        return (i for i, c in enumerate(self.codes) if c in codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+def _column_for(type_: TypeEngine[Any] | None) -> _Column:
+    if isinstance(type_, Boolean):
+        return _ArrayColumn("b", bool, (bool,))
+    if isinstance(type_, Integer):
+        return _ArrayColumn("q", int, (int,))
+    if isinstance(type_, Float):
+        return _ArrayColumn("d", float, (float, int))
+    return _DictColumn()
+
+
+class Snapshot:
+    """A compact, read-only copy of a table, stored column by column.
+
+    Created by :py:meth:`Table.snapshot() <dataset.Table.snapshot>`.
+    Integer, float and boolean columns are stored in typed arrays, other
+    columns are dictionary-encoded, so that repeated values (such as strings
+    or dates) are kept only once. Values that fit neither, like JSON data,
+    are kept in plain lists.
+
+    ``lookup`` and ``filter`` find rows by equality on some columns. They
+    use a hash index where one was built on exactly those columns, and
+    otherwise scan the columns.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        types: Sequence[TypeEngine[Any] | None],
+        row_type: RowFactory,
+    ) -> None:
+        self.columns = list(keys)
+        self.row_type = row_type
+        self._data: dict[str, _Column] = {
+            key: _column_for(type_) for key, type_ in zip(keys, types, strict=True)
+        }
+        self._length = 0
+        self._indexes: dict[Key, dict[Any, int | list[int]]] = {}
+
+    def _append(self, values: Sequence[Any]) -> None:
+        for key, value in zip(self.columns, values, strict=True):
+            column = self._data[key]
+            try:
+                column.append(value)
+            except (TypeError, OverflowError):
+                # The value doesn't fit the column's encoding, e.g. a float
+                # in an integer column, or an unhashable JSON value.
+                self._data[key] = self._fallback(column, value)
+        self._length += 1
+
+    def _fallback(self, column: _Column, value: Any) -> _Column:
+        replacement: _Column = _DictColumn()
+        if isinstance(column, _DictColumn) or not isinstance(value, Hashable):
+            replacement = _Column()
+        for index in range(len(column)):
+            replacement.append(column.get(index))
+        try:
+            replacement.append(value)
+        except TypeError:
+            return self._fallback(replacement, value)
+        return replacement
+
+    def _finish(self) -> None:
+        """Store columns with mostly distinct values as plain lists."""
+        for key, column in self._data.items():
+            if (
+                isinstance(column, _DictColumn)
+                and len(column.values) > len(column) // 2
+            ):
+                plain = _Column()
+                plain.values = [column.get(i) for i in range(len(column))]
+                self._data[key] = plain
+
+    def create_index(self, columns: str | Sequence[str]) -> None:
+        """Build a hash index for lookups on ``columns``."""
+        key = self._key(columns)
+        index: dict[Any, int | list[int]] = {}
+        data = [self._data[c] for c in key]
+        for position in range(self._length):
+            if len(data) == 1:
+                value = _hashed(data[0].get(position))
+            else:
+                value = tuple(_hashed(column.get(position)) for column in data)
+            found = index.get(value)
+            if found is None:
+                index[value] = position
+            elif isinstance(found, int):
+                index[value] = [found, position]
+            else:
+                found.append(position)
+        self._indexes[key] = index
+
+    def _key(self, columns: str | Iterable[str]) -> Key:
+        key = tuple(ensure_strings(columns))
+        for column in key:
+            if column not in self._data:
+                raise QueryError(f"No such column: {column}")
+        return key
+
+    def _positions(self, filters: dict[str, Any]) -> Iterator[int]:
+        if not filters:
+            return iter(range(self._length))
+        key = self._key(sorted(filters))
+        for columns, index in self._indexes.items():
+            if sorted(columns) == list(key):
+                if len(columns) == 1:
+                    found = index.get(_hashed(filters[columns[0]]))
+                else:
+                    found = index.get(tuple(_hashed(filters[c]) for c in columns))
+                if found is None:
+                    return iter(())
+                return iter([found] if isinstance(found, int) else found)
+        first, *rest = key
+        return (
+            position
+            for position in self._data[first].find(filters[first])
+            if all(_equal(self._data[c].get(position), filters[c]) for c in rest)
+        )
+
+    def row(self, position: int) -> OutRow:
+        """Return the row at ``position``."""
+        if not 0 <= position < self._length:
+            raise IndexError(position)
+        return self.row_type(
+            (key, self._data[key].get(position)) for key in self.columns
+        )
+
+    def lookup(self, **filters: Any) -> OutRow | None:
+        """Return the first row equal to ``filters``, or ``None``."""
+        for position in self._positions(filters):
+            return self.row(position)
+        return None
+
+    def filter(self, **filters: Any) -> list[OutRow]:
+        """Return all rows equal to ``filters``."""
+        return [self.row(position) for position in self._positions(filters)]
+
+    def column(self, name: str) -> list[Any]:
+        """Return all values of one column."""
+        data = self._data[self._key(name)[0]]
+        return [data.get(position) for position in range(self._length)]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[OutRow]:
+        return (self.row(position) for position in range(self._length))
+
+    def __repr__(self) -> str:
+        return f"<Snapshot({len(self)} rows, {len(self.columns)} columns)>"
@@ -1,21 +1,45 @@
 import logging
 import threading
+import time
 import warnings
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager, suppress
 from typing import TYPE_CHECKING, Any, Literal
-
-from sqlalchemy import false, func, select
-from sqlalchemy.exc import NoSuchTableError
+from uuid import uuid4
+
+from sqlalchemy import (
+    Connection,
+    Insert,
+    MetaData,
+    Result,
+    exists,
+    false,
+    func,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import FrozenResult
+from sqlalchemy.exc import DBAPIError, NoSuchTableError
 from sqlalchemy.schema import Column, Index
 from sqlalchemy.schema import Table as SQLATable
 from sqlalchemy.sql import and_, expression
 from sqlalchemy.sql.expression import (
     ClauseElement,
     ColumnElement,
+    Select,
     UnaryExpression,
     bindparam,
 )
 
+from dataset.advisor import IndexAdvisor
+from dataset.cache import CachedTable, LRUCache, statement_key
+from dataset.files import Source, load_rows, open_text, read_csv, read_jsonl
+from dataset.frames import dataframe_chunks, dataframe_types
+from dataset.prepared import PreparedLookup
+from dataset.snapshot import Snapshot
 from dataset.types import MYSQL_LENGTH_TYPES, ColumnType, Types
 from dataset.util import (
     QUERY_STEP,
@@ -70,6 +94,14 @@ class Table:
             primary_increment = self._primary_type in (Types.integer, Types.bigint)
         self._primary_increment = primary_increment
         self._auto_create = auto_create
+        self._advisor: IndexAdvisor | None = None
+        self._cache: LRUCache[FrozenResult[Any]] | None = None
+        self._count_cached = False
+        self._row_cache: CachedTable | None = None
+        self._row_count: int | None = None
+        self._deferred_indexes: (
+            list[tuple[list[str], str | None, dict[str, object]]] | None
+        ) = None
 
     @property
     def exists(self) -> bool:
@@ -156,6 +188,7 @@ class Table:
         """
         row = self._sync_columns(row, ensure, types=types)
         res = self.db.executable.execute(self.table.insert().values(row))
+        self._changed(1)
         self.db._auto_commit()
         if res.inserted_primary_key is not None and len(res.inserted_primary_key) > 0:
             return res.inserted_primary_key[0]
@@ -188,8 +221,9 @@ class Table:
         row = self._sync_columns(row, ensure, types=types)
         if self._check_ensure(ensure):
             self.create_index(keys)
+        self._index_keys(keys)
         args, _ = self._keys_to_args(row, keys)
-        if self.count(**args) == 0:
+        if self._count_primary(**args) == 0:
             return self.insert(row, ensure=False)
         return False
 
@@ -214,17 +248,7 @@ class Table:
             table.insert_many(rows)
         """
         # Sync table before inputting rows.
-        sync_row: MutableRow = {}
-        for row in rows:
-            # Only get non-existing columns.
-            sync_keys = list(sync_row.keys())
-            for key in [k for k in row if k not in sync_keys]:
-                # Get a sample of the new column(s) from the row.
-                sync_row[key] = row[key]
-        self._sync_columns(sync_row, ensure, types=types)
-
-        # Get columns name list to be used for padding later.
-        columns = sync_row.keys()
+        columns = self._sync_rows(rows, ensure, types=types)
 
         chunk: list[MutableRow] = []
         for index, row in enumerate(rows):
@@ -234,9 +258,248 @@ class Table:
             if len(chunk) == chunk_size or index == len(rows) - 1:
                 chunk = pad_chunk_columns(chunk, columns)
                 self.db.executable.execute(self.table.insert(), chunk)
+                self._changed(len(chunk))
                 self.db._auto_commit()
                 chunk = []
 
+    def insert_dataframe(
+        self,
+        df: Any,
+        chunk_size: int = 10000,
+        ensure: bool | None = None,
+        types: dict[str, ColumnType] | None = None,
+    ) -> int:
+        """Insert the rows of a ``pandas.DataFrame``.
+
+        New columns get a type chosen from the dtypes of ``df`` rather than
+        from sample values; ``types`` overrides it for individual columns.
+        The data is converted column by column, storing ``NaN``, ``NaT`` and
+        ``NA`` as ``NULL``, and written ``chunk_size`` rows at a time. On
+        SQLite, each chunk is passed to the driver's ``executemany`` as
+        tuples, without building a ``dict`` per row. The index of ``df`` is
+        not stored, call ``df.reset_index()`` to keep it.
+
+        Returns the number of inserted rows.
+        ::
+
+            table.insert_dataframe(pd.read_parquet('prices.parquet'))
+        """
+        names = [str(name) for name in df.columns]
+        if len(set(names)) != len(names):
+            raise DatasetError("Data frame column names must be unique.")
+        column_types = dataframe_types(df, self.db.types)
+        column_types.update(types or {})
+        row = self._sync_columns(dict.fromkeys(names), ensure, types=column_types)
+        positions: list[int] = []
+        columns: list[str] = []
+        for position, name in enumerate(names):
+            name = self._get_column_name(name)
+            if name in row:
+                positions.append(position)
+                columns.append(name)
+        chunks = dataframe_chunks(df, positions, chunk_size)
+        for start, values in zip(range(0, len(df), chunk_size), chunks, strict=True):
+            count = min(chunk_size, len(df) - start)
+            self._insert_columns(columns, values, count)
+        return len(df)
+
+    def _insert_columns(
+        self, columns: list[str], values: list[list[Any]], count: int
+    ) -> None:
+        """Insert ``count`` rows, given as one list of values per column."""
+        table = self.table
+        defaults = any(
+            c.default is not None for c in table.columns if c.name not in columns
+        )
+        if self.db.is_sqlite and columns and not defaults:
+            # Apply the type conversions SQLAlchemy would make (dates, JSON)
+            # per column, then hand the rows to sqlite3 as tuples.
+            conn = self.db.executable
+            dialect = conn.dialect
+            for index, column in enumerate(columns):
+                type_ = table.c[column].type.dialect_impl(dialect)
+                process = type_.bind_processor(dialect)
+                if process is not None:
+                    values[index] = [process(value) for value in values[index]]
+            preparer = dialect.identifier_preparer
+            names = ", ".join(preparer.quote(column) for column in columns)
+            marks = ", ".join("?" * len(columns))
+            stmt = f"INSERT INTO {preparer.format_table(table)} ({names}) "
+            stmt += f"VALUES ({marks})"
+            conn.exec_driver_sql(stmt, list(zip(*values, strict=True)))
+        else:
+            rows: list[MutableRow] = [{} for _ in range(count)]
+            if columns:
+                rows = [
+                    dict(zip(columns, row, strict=True))
+                    for row in zip(*values, strict=True)
+                ]
+            self.db.executable.execute(table.insert(), rows)
+        self._changed(count)
+        self.db._auto_commit()
+
+    def insert_ignore_many(
+        self,
+        rows: Iterable[WriteRow],
+        keys: Sequence[str],
+        chunk_size: int = 1000,
+        ensure: bool | None = None,
+        types: dict[str, ColumnType] | None = None,
+    ) -> None:
+        """Add many rows at a time, skipping those that already exist.
+
+        This is the bulk version of :py:meth:`insert_ignore()
+        <dataset.Table.insert_ignore>`: rows whose ``keys`` match an existing
+        row, or an earlier row of the input, are not inserted. ``rows`` may be
+        any iterable and is consumed in chunks of ``chunk_size``.
+
+        If a unique index or primary key covers exactly the ``keys``, each
+        chunk is written with ``INSERT ... ON CONFLICT DO NOTHING`` (or
+        ``INSERT IGNORE`` on MySQL). Otherwise the existing keys of each chunk
+        are looked up with a single query and only new rows are inserted.
+        ::
+
+            table.insert_ignore_many(events, ['event_id'])
+        """
+        keys = [self._get_column_name(k) for k in ensure_strings(keys)]
+        chunk: list[MutableRow] = []
+        for row in rows:
+            chunk.append(dict(row))
+            if len(chunk) == chunk_size:
+                self._insert_ignore_chunk(chunk, keys, ensure, types)
+                chunk = []
+        if chunk:
+            self._insert_ignore_chunk(chunk, keys, ensure, types)
+
+    def _insert_ignore_chunk(
+        self,
+        chunk: list[MutableRow],
+        keys: list[str],
+        ensure: bool | None,
+        types: dict[str, ColumnType] | None,
+    ) -> None:
+        columns = self._sync_rows(chunk, ensure, types=types)
+        if self._check_ensure(ensure):
+            self.create_index(keys)
+        self._index_keys(keys)
+        chunk = pad_chunk_columns(chunk, columns)
+        if self._has_unique(keys):
+            stmt = self._insert_ignore_statement(keys)
+            if stmt is not None:
+                self.db.executable.execute(stmt, chunk)
+                self._changed()
+                self.db._auto_commit()
+                return
+        chunk = self._filter_existing(chunk, keys)
+        if chunk:
+            self.db.executable.execute(self.table.insert(), chunk)
+            self._changed(len(chunk))
+            self.db._auto_commit()
+
+    def _insert_ignore_statement(self, keys: list[str]) -> Insert | None:
+        """An INSERT that skips rows conflicting on ``keys``, if supported."""
+        if self.db.is_postgres:
+            return pg_insert(self.table).on_conflict_do_nothing(index_elements=keys)
+        if self.db.is_sqlite:
+            return sqlite_insert(self.table).on_conflict_do_nothing(index_elements=keys)
+        if self.db.is_mysql:
+            return self.table.insert().prefix_with("IGNORE")
+        return None
+
+    def _has_unique(self, columns: list[str]) -> bool:
+        """Check for a unique index or constraint on exactly ``columns``."""
+        wanted = set(columns)
+        if wanted == {c.name for c in self.table.primary_key.columns}:
+            return True
+        for index in self.db.inspect.get_indexes(self.name, schema=self.db.schema):
+            if index.get("unique") and set(index["column_names"]) == wanted:
+                return True
+        uniques = self.db.inspect.get_unique_constraints(
+            self.name, schema=self.db.schema
+        )
+        return any(set(u["column_names"]) == wanted for u in uniques)
+
+    def _filter_existing(
+        self, chunk: list[MutableRow], keys: list[str]
+    ) -> list[MutableRow]:
+        """Drop rows whose ``keys`` exist in the table or earlier in the chunk."""
+        candidates: dict[tuple[Any, ...], MutableRow] = {}
+        for row in chunk:
+            key = tuple(row.get(k) for k in keys)
+            if key in candidates:
+                continue
+            if None in key:
+                # NULLs never match an IN list, so look these up one by one.
+                args = dict(zip(keys, key, strict=True))
+                if self._count_primary(**args) > 0:
+                    continue
+            candidates[key] = row
+        lookup = [k for k in candidates if None not in k]
+        if lookup:
+            columns = [self.table.c[k] for k in keys]
+            if len(columns) == 1:
+                clause = columns[0].in_([k[0] for k in lookup])
+            else:
+                clause = tuple_(*columns).in_(lookup)
+            rp = self.db.executable.execute(select(*columns).where(clause))
+            for existing in rp.fetchall():
+                candidates.pop(tuple(existing), None)
+        return list(candidates.values())
+
+    def load_csv(
+        self,
+        source: Source,
+        chunk_size: int = 1000,
+        sample_size: int = 1000,
+        types: dict[str, ColumnType] | None = None,
+        ensure: bool | None = None,
+        encoding: str = "utf-8",
+        **fmtparams: Any,
+    ) -> int:
+        """Stream rows from a CSV file into the table.
+
+        ``source`` is a path (read as gzip if it ends in ``.gz``) or an open
+        text file. The file is read and inserted ``chunk_size`` rows at a
+        time, so memory use does not depend on its size. Column types are
+        inferred from the first ``sample_size`` rows: integers, floats,
+        booleans and ISO dates or datetimes are stored as such, and empty
+        strings in those columns become ``NULL``. ``types`` overrides the
+        inferred type of individual columns. Extra keyword arguments are
+        passed to :py:class:`csv.DictReader`.
+
+        Progress and throughput are logged; returns the number of rows loaded.
+        ::
+
+            table.load_csv('people.csv')
+            table.load_csv('export.tsv.gz', delimiter='\\t')
+        """
+        with open_text(source, "r", encoding) as fh:
+            rows = read_csv(fh, **fmtparams)
+            return load_rows(self, rows, True, chunk_size, sample_size, types, ensure)
+
+    def load_jsonl(
+        self,
+        source: Source,
+        chunk_size: int = 1000,
+        sample_size: int = 1000,
+        types: dict[str, ColumnType] | None = None,
+        ensure: bool | None = None,
+        encoding: str = "utf-8",
+    ) -> int:
+        """Stream rows from a file with one JSON object per line.
+
+        Works like :py:meth:`load_csv() <dataset.Table.load_csv>`, except
+        that values keep their JSON types. Column types are chosen from all
+        sample values, so that mixed integers and floats make a float column
+        and nested objects and lists are stored as JSON.
+        ::
+
+            table.load_jsonl('events.jsonl.gz')
+        """
+        with open_text(source, "r", encoding) as fh:
+            rows = read_jsonl(fh)
+            return load_rows(self, rows, False, chunk_size, sample_size, types, ensure)
+
     def update(
         self,
         row: WriteRow,
@@ -262,17 +525,21 @@ class Table:
         the behavior of :py:meth:`insert() <dataset.Table.insert>`.
         """
         row = self._sync_columns(row, ensure, types=types)
+        self._index_keys(keys)
         args, row = self._keys_to_args(row, keys)
         clause = self._args_to_clause(args)
         if not len(row):
-            return self.count(clause)
+            return self._count_primary(clause)
         stmt = self.table.update().where(clause).values(row)
+        started = self._observe_start()
         rp = self.db.executable.execute(stmt)
+        self._observe(args, started)
+        self._changed(0, args)
         self.db._auto_commit()
         if rp.supports_sane_rowcount():
             return rp.rowcount
         if return_count:
-            return self.count(clause)
+            return self._count_primary(clause)
         return False
 
     def update_many(
@@ -293,6 +560,7 @@ class Table:
         the other parameters.
         """
         keys = ensure_strings(keys)
+        self._index_keys(keys)
 
         chunk: list[MutableRow] = []
         columns: list[str] = []
@@ -317,6 +585,7 @@ class Table:
                     .values({col: bindparam(col, required=False) for col in columns})
                 )
                 self.db.executable.execute(stmt, chunk)
+                self._changed(0)
                 self.db._auto_commit()
                 chunk = []
 
@@ -364,7 +633,136 @@ class Table:
         for row in rows:
             self.upsert(row, keys, ensure=ensure, types=types)
 
-    def delete(self, *clauses: ColumnElement[bool], **filters: SQLWriteValue) -> bool:
+    def merge_from(
+        self,
+        rows: Sequence[WriteRow],
+        keys: Sequence[str],
+        chunk_size: int = 10000,
+        delete_missing: bool = False,
+        ensure: bool | None = None,
+        types: dict[str, ColumnType] | None = None,
+    ) -> None:
+        """Upsert a large set of rows using a few set-based statements.
+
+        The rows are bulk-loaded into a temporary staging table with the same
+        column types, in chunks of ``chunk_size``. Existing rows matching on
+        ``keys`` are then updated with one ``UPDATE ... FROM`` statement and
+        the remaining rows added with one ``INSERT ... SELECT``. Only columns
+        used by ``rows`` are written; rows lacking one of them set it to
+        ``NULL``, as in :py:meth:`insert_many() <dataset.Table.insert_many>`.
+        If ``delete_missing`` is set,
+        rows of the table whose keys do not occur in ``rows`` are deleted,
+        which turns the merge into a full synchronisation.
+
+        The keys are expected to be unique within ``rows``. All changes are
+        committed together at the end, unless inside a transaction.
+        ::
+
+            table.merge_from(rows, ['id'])
+            # make the table an exact copy of `rows`:
+            table.merge_from(rows, ['code'], delete_missing=True)
+        """
+        names = self._sync_rows(rows, ensure, types=types)
+        keys = [self._get_column_name(k) for k in ensure_strings(keys)]
+        for key in keys:
+            if not self.has_column(key):
+                raise DatasetError(f"No such column: {key}")
+        if self._check_ensure(ensure):
+            self.create_index(keys)
+        self._index_keys(keys)
+        mapping = {}
+        for name in names:
+            column = self._get_column_name(name)
+            if self.has_column(column):
+                mapping[name] = column
+        columns = list(dict.fromkeys([*keys, *mapping.values()]))
+
+        conn = self.db.executable
+        staging = SQLATable(
+            f"{self.name[:40]}_merge_{uuid4().hex[:12]}",
+            MetaData(),
+            *[Column(c, self.table.c[c].type) for c in columns],
+            prefixes=["TEMPORARY"],
+        )
+        staging.create(conn)
+        try:
+            chunk: list[MutableRow] = []
+            for row in rows:
+                record: MutableRow = dict.fromkeys(columns)
+                for name, value in row.items():
+                    if name in mapping:
+                        record[mapping[name]] = value
+                chunk.append(record)
+                if len(chunk) == chunk_size:
+                    conn.execute(staging.insert(), chunk)
+                    chunk = []
+            if chunk:
+                conn.execute(staging.insert(), chunk)
+            Index(f"{staging.name}_keys", *[staging.c[k] for k in keys]).create(conn)
+
+            match = and_(*[self.table.c[k] == staging.c[k] for k in keys])
+            values = {c: staging.c[c] for c in columns if c not in keys}
+            if values:
+                conn.execute(self.table.update().where(match).values(values))
+            existing = exists().where(match)
+            new_rows = select(*[staging.c[c] for c in columns]).where(~existing)
+            conn.execute(self.table.insert().from_select(columns, new_rows))
+            if delete_missing:
+                source = exists().where(match)
+                conn.execute(self.table.delete().where(~source))
+        except BaseException:
+            in_transaction = self.db.in_transaction
+            if not in_transaction:
+                conn.rollback()
+            # After a failed statement, PostgreSQL rejects the drop until the
+            # transaction is rolled back, which removes the table as well.
+            with suppress(DBAPIError):
+                staging.drop(conn, checkfirst=True)
+                if not in_transaction:
+                    conn.commit()
+            raise
+        staging.drop(conn)
+        self._changed()
+        self.db._auto_commit()
+
+    def update_where(
+        self,
+        values: WriteRow,
+        *_clauses: ColumnElement[bool],
+        **filters: SQLWriteValue,
+    ) -> int:
+        """Set ``values`` on all rows matching the given filters.
+
+        Unlike :py:meth:`update() <dataset.Table.update>`, the filters are
+        separate from the new values and support the operators of
+        :py:meth:`find() <dataset.Table.find>`. The update runs as a single
+        statement; the number of changed rows is returned where the database
+        reports it, otherwise ``-1``.
+        ::
+
+            table.update_where({'status': 'stale'}, updated={'<': cutoff})
+        """
+        if not self.exists:
+            return 0
+        values = self._sync_columns(values, None)
+        if not len(values):
+            return 0
+        clause = self._args_to_clause(filters, clauses=_clauses)
+        stmt = self.table.update().where(clause).values(values)
+        started = self._observe_start()
+        rp = self.db.executable.execute(stmt)
+        self._observe(filters, started)
+        self._changed(0)
+        self.db._auto_commit()
+        return rp.rowcount
+
+    def delete(
+        self,
+        *clauses: ColumnElement[bool],
+        _chunk_size: int | None = None,
+        _callback: Callable[[int], None] | None = None,
+        **filters: SQLWriteValue,
+    ) -> bool:
         """Delete rows from the table.
 
         Keyword arguments can be used to add column-based filters. The filter
@@ -374,15 +772,114 @@ class Table:
             table.delete(place='Berlin')
 
         If no arguments are given, all records are deleted.
+
+        Deleting many rows in one statement can lock a table for a long
+        time. Set ``_chunk_size`` to delete the matching rows in batches of
+        that size instead, committing after each batch (unless inside a
+        transaction). This requires a single-column primary key. If given,
+        ``_callback`` is called after each batch with the number of rows
+        deleted so far, as in :py:meth:`delete_many()
+        <dataset.Table.delete_many>`.
+        ::
+
+            table.delete(created={'<': cutoff}, _chunk_size=10000)
         """
+        if _chunk_size is not None and _chunk_size < 1:
+            raise DatasetError(f"Invalid chunk size: {_chunk_size}")
         if not self.exists:
             return False
         clause = self._args_to_clause(filters, clauses=clauses)
+        if _chunk_size is not None:
+            return self._delete_chunked(clause, _chunk_size, _callback) > 0
         stmt = self.table.delete().where(clause)
+        started = self._observe_start()
         rp = self.db.executable.execute(stmt)
+        self._observe(filters, started)
+        self._changed(
+            -rp.rowcount if rp.rowcount >= 0 else None,
+            None if clauses else filters,
+        )
         self.db._auto_commit()
         return rp.rowcount > 0
 
+    def delete_many(
+        self,
+        keys: Iterable[Any],
+        column: str | None = None,
+        chunk_size: int = 1000,
+        callback: Callable[[int], None] | None = None,
+    ) -> int:
+        """Delete all rows whose ``column`` matches one of the given ``keys``.
+
+        ``column`` defaults to the primary key. The keys are deleted with one
+        ``IN`` statement per ``chunk_size`` keys, committing between chunks
+        (unless inside a transaction). If given, ``callback`` is called after
+        each chunk with the number of rows deleted so far. Returns the total
+        number of deleted rows.
+        ::
+
+            table.delete_many(expired_ids)
+            table.delete_many(['a', 'b'], column='code', chunk_size=500)
+        """
+        if not self.exists:
+            return 0
+        if column is None:
+            target = self._primary_column()
+        else:
+            name = self._get_column_name(column)
+            if not self.has_column(name):
+                raise DatasetError(f"No such column: {name}")
+            target = self.table.c[name]
+        total = 0
+        chunk: list[Any] = []
+        for key in keys:
+            chunk.append(key)
+            if len(chunk) == chunk_size:
+                total += self._delete_keys(target, chunk)
+                chunk = []
+                if callback is not None:
+                    callback(total)
+        if chunk:
+            total += self._delete_keys(target, chunk)
+            if callback is not None:
+                callback(total)
+        return total
+
+    def _primary_column(self) -> Column[Any]:
+        columns = list(self.table.primary_key.columns)
+        if len(columns) != 1:
+            raise DatasetError(f"Table has no single-column primary key: {self.name}")
+        return columns[0]
+
+    def _delete_keys(self, column: Column[Any], keys: list[Any]) -> int:
+        rp = self.db.executable.execute(self.table.delete().where(column.in_(keys)))
+        deleted = max(rp.rowcount, 0)
+        self._changed(-deleted if rp.rowcount >= 0 else None)
+        self.db._auto_commit()
+        return deleted
+
+    def _delete_chunked(
+        self,
+        clause: ColumnElement[bool],
+        chunk_size: int,
+        callback: Callable[[int], None] | None,
+    ) -> int:
+        """Delete the rows matching ``clause`` in batches of primary keys."""
+        pk = self._primary_column()
+        query = select(pk).where(clause).limit(chunk_size)
+        total = 0
+        while True:
+            keys = [r[0] for r in self.db.executable.execute(query).fetchall()]
+            if not keys:
+                break
+            total += self._delete_keys(pk, keys)
+            log.info("Deleted %d rows from %s", total, self.name)
+            if callback is not None:
+                callback(total)
+            if len(keys) < chunk_size:
+                break
+        return total
+
     def _reflect_table(self) -> None:
         """Load the tables definition from the database."""
         with self.db.lock:
@@ -442,6 +939,7 @@ class Table:
                         self._table.append_column(column)
                 self._table.create(self.db.executable, checkfirst=True)
                 self._columns = None
+                self._changed()
                 self.db._auto_commit()
         elif len(columns):
             with self.db.lock:
@@ -451,6 +949,7 @@ class Table:
                     if not self.has_column(column.name):
                         self.db.op.add_column(self.name, column, schema=self.db.schema)
                 self._reflect_table()
+                self._changed(0)
                 self.db._auto_commit()
 
     def _sync_columns(
@@ -483,6 +982,24 @@ class Table:
         self._sync_table(list(sync_columns.values()))
         return out
 
+    def _sync_rows(
+        self,
+        rows: Iterable[WriteRow],
+        ensure: bool | None,
+        types: dict[str, ColumnType] | None = None,
+    ) -> list[str]:
+        """Create the columns used by any of ``rows``; return their names."""
+        sync_row: MutableRow = {}
+        for row in rows:
+            # Only get non-existing columns.
+            for key in row:
+                if key not in sync_row:
+                    # Get a sample of the new column(s) from the row.
+                    sync_row[key] = row[key]
+        self._sync_columns(sync_row, ensure, types=types)
+        # Get columns name list to be used for padding later.
+        return list(sync_row.keys())
+
     def _check_ensure(self, ensure: bool | None) -> bool:
         if ensure is None:
             return self.db.ensure_schema
@@ -553,6 +1070,17 @@ class Table:
                 clauses.append(self._generate_clause(column, "=", value))
         return and_(True, *clauses)
 
+    def _observe_start(self) -> float:
+        """Prepare a filtered statement for the index advisor, if enabled."""
+        if self._advisor is not None:
+            self._advisor.flush()
+        return time.perf_counter()
+
+    def _observe(self, filters: Iterable[str], started: float) -> None:
+        """Report a filtered statement's columns to the index advisor."""
+        if self._advisor is not None:
+            self._advisor.record(filters, time.perf_counter() - started)
+
     def _args_to_order_by(
         self, order_by: str | Sequence[str] | None
     ) -> list[UnaryExpression[Any]]:
@@ -570,6 +1098,25 @@ class Table:
                 orderings.append(self.table.c[column].asc())
         return orderings
 
+    def _args_to_columns(self, columns: str | Sequence[str]) -> list[Column[Any]]:
+        """Resolve a ``_columns`` projection, where ``-name`` excludes."""
+        included: list[str] = []
+        excluded: set[str] = set()
+        for name in ensure_strings(columns):
+            if name.startswith("-"):
+                excluded.add(self._get_column_name(name[1:]))
+                continue
+            name = self._get_column_name(name)
+            if not self.has_column(name):
+                raise DatasetError(f"No such column: {name}")
+            included.append(name)
+        if not included:
+            included = [c.name for c in self.table.columns]
+        selected = [self.table.c[c] for c in included if c not in excluded]
+        if not selected:
+            raise QueryError("No columns left to select")
+        return selected
+
     def _keys_to_args(
         self, row: WriteRow, keys: Sequence[str]
     ) -> tuple[MutableRow, MutableRow]:
@@ -638,6 +1185,7 @@ class Table:
             self._threading_warn()
             self.db.op.drop_column(self.table.name, name, schema=self.table.schema)
             self._reflect_table()
+            self._changed(0)
             self.db._auto_commit()
 
     def drop(self) -> None:
@@ -652,6 +1200,7 @@ class Table:
                 self._table = None
                 self._columns = None
                 self.db._tables.pop(self.name, None)
+                self._changed()
                 self.db._auto_commit()
 
     def has_index(self, columns: Iterable[str]) -> bool:
@@ -677,6 +1226,30 @@ class Table:
                 return True
         return False
 
+    def advise_indexes(
+        self, auto_index: bool = False, min_calls: int = 100
+    ) -> IndexAdvisor:
+        """Record filter usage on this table to find missing indexes.
+
+        Returns an :py:class:`IndexAdvisor <dataset.advisor.IndexAdvisor>`
+        which counts the keyword filter columns of ``find``, ``count``,
+        ``update`` and ``delete`` and their latency. Column sets used at least
+        ``min_calls`` times without a covering index are listed by its
+        ``suggestions()``. If ``auto_index`` is set, such indexes are created
+        automatically.
+        ::
+
+            advisor = table.advise_indexes()
+            # ... run the application ...
+            for usage in advisor.suggestions():
+                print(usage.columns, usage.calls, usage.mean_time)
+        """
+        if self._advisor is None:
+            self._advisor = IndexAdvisor(self, auto_index, min_calls)
+        self._advisor.auto_index = auto_index
+        self._advisor.min_calls = min_calls
+        return self._advisor
+
     def create_index(
         self, columns: Sequence[str], name: str | None = None, **kw: object
     ) -> None:
@@ -688,6 +1261,19 @@ class Table:
             table.create_index(['name', 'country'])
         """
         columns = [self._get_column_name(c) for c in ensure_strings(columns)]
+        with self.db.lock:
+            if self._deferred_indexes is not None:
+                # Built when the surrounding bulk_load() block ends.
+                queued = [set(c) for c, _, _ in self._deferred_indexes]
+                if set(columns) not in queued:
+                    self._deferred_indexes.append((columns, name, kw))
+                return
+            self._build_index(columns, name, kw)
+
+    def _build_index(
+        self, columns: list[str], name: str | None, kw: dict[str, object]
+    ) -> None:
+        """Create an index on ``columns`` unless one covers them already."""
         with self.db.lock:
             if not self.exists:
                 raise DatasetError("Table has not been created yet.")
@@ -715,6 +1301,90 @@ class Table:
                 idx.create(self.db.executable)
                 self.db._auto_commit()
 
+    def _index_keys(self, keys: Sequence[str]) -> None:
+        """Build a deferred index on ``keys`` now, for writes that look them up."""
+        if not self._deferred_indexes:
+            return
+        wanted = {self._get_column_name(k) for k in ensure_strings(keys)}
+        with self.db.lock:
+            for entry in self._deferred_indexes or []:
+                if set(entry[0]) == wanted:
+                    self._deferred_indexes.remove(entry)
+                    self._build_index(*entry)
+                    return
+
+    @contextmanager
+    def bulk_load(self, analyze: bool = False) -> Iterator["Table"]:
+        """Defer index maintenance while loading a lot of data.
+
+        On entry, the non-unique secondary indexes of the table are dropped,
+        and indexes requested during the block, e.g. by ``create_index`` or by
+        ``upsert`` with ``ensure``, are queued instead of being created. When
+        the block ends, even with an error, all of them are built once. Unique
+        indexes and the primary key are kept, since they enforce constraints,
+        and so are indexes on expressions or with database-specific options,
+        such as partial or prefix indexes, which could not be rebuilt as they
+        were. An index on the ``keys`` of an ``update``, ``upsert``,
+        ``insert_ignore`` or ``merge_from`` in the block is built again when
+        such a write first runs, since it looks up existing rows by them. With
+        ``analyze`` set, the table statistics are refreshed afterwards.
+        ::
+
+            with table.bulk_load(analyze=True):
+                table.insert_many(rows)
+        """
+        with self.db.lock:
+            if self._deferred_indexes is not None:
+                raise DatasetError("A bulk load is already in progress.")
+            dropped: list[tuple[list[str], str | None, dict[str, object]]] = []
+            if self.exists:
+                for index in self.db.inspect.get_indexes(
+                    self.name, schema=self.db.schema
+                ):
+                    name = index["name"]
+                    columns = index.get("column_names", [])
+                    # Option values can be SQL clauses, which have no truth value.
+                    options = [
+                        value
+                        for value in index.get("dialect_options", {}).values()
+                        if value is not None
+                        and (not isinstance(value, (bool, str, list, dict)) or value)
+                    ]
+                    if (
+                        index.get("unique")
+                        or name is None
+                        or None in columns
+                        or options
+                        or index.get("column_sorting")
+                    ):
+                        continue
+                    self._threading_warn()
+                    self.db.op.drop_index(
+                        name, table_name=self.name, schema=self.db.schema
+                    )
+                    dropped.append(([str(c) for c in columns], name, {}))
+                self._indexes = []
+                self.db._auto_commit()
+            self._deferred_indexes = dropped
+        try:
+            yield self
+        finally:
+            with self.db.lock:
+                pending, self._deferred_indexes = self._deferred_indexes, None
+                if self.exists:
+                    for idx_columns, idx_name, kw in pending:
+                        self._build_index(idx_columns, idx_name, kw)
+                    if analyze:
+                        self._analyze()
+
+    def _analyze(self) -> None:
+        """Update the query planner statistics of the table."""
+        preparer = self.db.executable.dialect.identifier_preparer
+        name = preparer.format_table(self.table)
+        keyword = "ANALYZE TABLE" if self.db.is_mysql else "ANALYZE"
+        self.db.executable.execute(text(f"{keyword} {name}"))
+        self.db._auto_commit()
+
     def find(
         self,
         *_clauses: ColumnElement[bool],
@@ -723,6 +1393,7 @@ class Table:
         order_by: str | Sequence[str] | None = None,
         _streamed: bool = False,
         _step: int | None = QUERY_STEP,
+        _columns: str | Sequence[str] | None = None,
         **kwargs: SQLWriteValue,
     ) -> ResultIter:
         """Perform a simple search on the table.
@@ -746,12 +1417,21 @@ class Table:
             # return all rows sorted by multiple columns (descending by year)
             results = table.find(order_by=['country', '-year'])
 
+        To fetch only some of the columns, list them in ``_columns``. Names
+        prefixed with a minus sign are left out instead, which is handy for
+        skipping large text or JSON fields::
+
+            results = table.find(country='France', _columns=['city', 'year'])
+            results = table.find(_columns='-payload')
+
         You can also submit filters based on criteria other than equality,
         see :ref:`advanced_filters` for details.
 
-        To run more complex queries with JOINs, or to perform GROUP BY-style
-        aggregation, you can also use :py:meth:`db.query() <dataset.Database.query>`
-        to run raw SQL queries instead.
+        For GROUP BY-style aggregation, see
+        :py:meth:`aggregate() <dataset.Table.aggregate>`. To run more complex
+        queries with JOINs, you can also use
+        :py:meth:`db.query() <dataset.Database.query>` to run raw SQL queries
+        instead.
         """
         if not self.exists:
             return ResultIter(None, row_type=self.db.row_type)
@@ -761,24 +1441,164 @@ class Table:
         if _step is False or _step == 0:
             _step = None
 
-        orderings = self._args_to_order_by(order_by)
-        args = self._args_to_clause(kwargs, clauses=_clauses)
-        query = self.table.select().where(args).limit(_limit).offset(_offset)
-        if len(orderings):
-            query = query.order_by(*orderings)
+        query = self._find_query(_clauses, kwargs, _limit, _offset, order_by, _columns)
 
-        stream_conn = None
-        conn = self.db.executable
+        stream_conn: Connection | None
+        rp: Result[Any]
+        started = self._observe_start()
         if _streamed:
-            stream_conn = self.db.engine.connect()
+            stream_conn = self.db._read_connection() or self.db.engine.connect()
             conn = stream_conn.execution_options(stream_results=True)
-
+            rp = conn.execute(query)
+        else:
+            rp, stream_conn = self._execute_read(query)
+        self._observe(kwargs, started)
         return ResultIter(
-            conn.execute(query),
+            rp,
             row_type=self.db.row_type,
             step=_step,
             connection=stream_conn,
+            types=[column.type for column in query.selected_columns],
+        )
+
+    def export(
+        self,
+        target: Source,
+        *_clauses: ColumnElement[bool],
+        _format: str | None = None,
+        _limit: int | None = None,
+        _offset: int = 0,
+        order_by: str | Sequence[str] | None = None,
+        _columns: str | Sequence[str] | None = None,
+        _step: int | None = QUERY_STEP,
+        _fmtparams: Mapping[str, Any] | None = None,
+        **kwargs: SQLWriteValue,
+    ) -> int:
+        """Write the rows matching a filter to a CSV or JSON lines file.
+
+        Filtering, ordering and ``_columns`` work as in
+        :py:meth:`find() <dataset.Table.find>`. The rows are streamed to
+        ``target`` as described in :py:meth:`db.export_query()
+        <dataset.Database.export_query>`, which picks the format from the file
+        name unless ``_format`` is ``'csv'`` or ``'jsonl'``, and passes
+        ``_fmtparams`` on to the CSV writer. Returns the number of rows
+        written.
+        ::
+
+            table.export('france.csv', country='France', order_by='year')
+            table.export('all.jsonl.gz', _columns='-payload')
+        """
+        if not self.exists:
+            raise DatasetError(f"Table does not exist: {self.name}")
+        query = self._find_query(_clauses, kwargs, _limit, _offset, order_by, _columns)
+        return self.db.export_query(
+            query, target, _format=_format, _step=_step, _fmtparams=_fmtparams
+        )
+
+    def to_pandas(
+        self,
+        *_clauses: ColumnElement[bool],
+        _limit: int | None = None,
+        _offset: int = 0,
+        order_by: str | Sequence[str] | None = None,
+        _columns: str | Sequence[str] | None = None,
+        **kwargs: SQLWriteValue,
+    ) -> Any:
+        """Load the rows matching a filter into a ``pandas.DataFrame``.
+
+        Filtering, ordering and ``_columns`` work as in
+        :py:meth:`find() <dataset.Table.find>`. The rows are fetched in
+        batches of raw tuples and converted column by column, with dtypes
+        chosen from the column types: ``int64``, ``float64``, ``bool`` and
+        ``datetime64``, or the nullable ``Int64`` and ``boolean`` dtypes for
+        columns with ``NULL`` values. Requires pandas.
+        ::
+
+            df = table.to_pandas(country='France', _columns=['city', 'year'])
+        """
+        rows = self.find(
+            *_clauses,
+            _limit=_limit,
+            _offset=_offset,
+            order_by=order_by,
+            _columns=_columns,
+            **kwargs,  # type: ignore[arg-type]
+        )
+        return rows.to_pandas()
+
+    def iter_dataframes(
+        self,
+        *_clauses: ColumnElement[bool],
+        _chunk_rows: int = 10000,
+        _limit: int | None = None,
+        _offset: int = 0,
+        order_by: str | Sequence[str] | None = None,
+        _columns: str | Sequence[str] | None = None,
+        **kwargs: SQLWriteValue,
+    ) -> Iterator[Any]:
+        """Stream the rows matching a filter as ``pandas.DataFrame`` chunks.
+
+        Works like :py:meth:`to_pandas() <dataset.Table.to_pandas>`, but the
+        query is streamed and yields data frames of at most ``_chunk_rows``
+        rows, so memory use is bounded by the chunk size.
+        ::
+
+            for df in table.iter_dataframes(_chunk_rows=50000):
+                df.to_parquet(...)
+        """
+        rows = self.find(
+            *_clauses,
+            _limit=_limit,
+            _offset=_offset,
+            order_by=order_by,
+            _streamed=True,
+            _step=_chunk_rows,
+            _columns=_columns,
+            **kwargs,
         )
+        return rows.iter_dataframes(_chunk_rows)
+
+    def snapshot(
+        self,
+        *_clauses: ColumnElement[bool],
+        _columns: str | Sequence[str] | None = None,
+        index: str | Iterable[str | Sequence[str]] | None = None,
+        **kwargs: SQLWriteValue,
+    ) -> Snapshot:
+        """Load the table, or the rows matching a filter, into memory.
+
+        Returns a :py:class:`Snapshot <dataset.snapshot.Snapshot>`, which
+        stores the rows column by column in compact arrays and takes much
+        less memory than ``list(table.find())``. Filters and ``_columns``
+        work as in :py:meth:`find() <dataset.Table.find>`. ``index`` names
+        the columns, or a list of column sets, to build hash indexes on, so
+        that lookups on them take constant time.
+        ::
+
+            countries = db['countries'].snapshot(index=['code', ['name', 'region']])
+            row = countries.lookup(code='de')
+            rows = countries.filter(region='Europe')
+        """
+        if not self.exists:
+            return Snapshot([], [], self.db.row_type)
+        query = self._find_query(_clauses, kwargs, columns=_columns)
+        rp, conn = self._execute_read(query)
+        try:
+            types = [column.type for column in query.selected_columns]
+            snapshot = Snapshot(list(rp.keys()), types, self.db.row_type)
+            while batch := rp.fetchmany(QUERY_STEP):
+                for row in batch:
+                    snapshot._append(row)
+        finally:
+            rp.close()
+            if conn is not None:
+                conn.close()
+        snapshot._finish()
+        if isinstance(index, str):
+            index = [index]
+        for columns in index or []:
+            snapshot.create_index(columns)
+        return snapshot
 
     def find_one(
         self, *args: ColumnElement[bool], **kwargs: SQLWriteValue
@@ -786,10 +1606,11 @@ class Table:
         """Get a single result from the table.
 
         Works just like :py:meth:`find() <dataset.Table.find>` but returns one
-        result, or ``None``.
+        result, or ``None``. This includes ``order_by`` and ``_columns``.
         ::
 
             row = table.find_one(country='United States')
+            row = table.find_one(country='United States', _columns=['name'])
         """
         if not self.exists:
             return None
@@ -802,26 +1623,131 @@ class Table:
             resiter.close()
         return None
 
-    def count(self, *_clauses: ColumnElement[bool], **kwargs: SQLWriteValue) -> int:
-        """Return the count of results for the given filter set."""
+    def prepared_lookup(self, columns: str | Sequence[str]) -> PreparedLookup:
+        """Build a fast lookup for rows by the values of some ``columns``.
+
+        For hot paths that call ``find_one()`` with the same filter columns
+        over and over, the returned :py:class:`PreparedLookup
+        <dataset.prepared.PreparedLookup>` builds its query once and fetches
+        rows with little overhead. Values are passed in the order of
+        ``columns``.
+        ::
+
+            by_code = table.prepared_lookup(['country', 'code'])
+            row = by_code('de', 'BER')
+            rows = by_code.all('de', 'BER')
+        """
+        return PreparedLookup(self, columns)
+
+    def count(
+        self,
+        *_clauses: ColumnElement[bool],
+        _approximate: bool = False,
+        **kwargs: SQLWriteValue,
+    ) -> int:
+        """Return the count of results for the given filter set.
+
+        Counting every row of a large table can be slow. Without filters,
+        ``_approximate`` returns the row estimate kept by the database's
+        statistics instead: ``pg_class.reltuples`` on PostgreSQL,
+        ``information_schema.TABLES`` on MySQL and ``sqlite_stat1`` on SQLite
+        (populated by ``ANALYZE``). If no estimate is available, the exact
+        count is returned.
+        ::
+
+            table.count(_approximate=True)
+        """
         # NOTE: this does not have support for limit and offset since I can't
         # see how this is useful. Still, there might be compatibility issues
         # with people using these flags. Let's see how it goes.
         if not self.exists:
             return 0
 
-        args = self._args_to_clause(kwargs, clauses=_clauses)
-        query = select(func.count()).where(args)
-        query = query.select_from(self.table)
-        rp = self.db.executable.execute(query)
-        res = rp.fetchone()
+        if _approximate and not _clauses and not kwargs:
+            estimate = self._approximate_count()
+            if estimate is not None:
+                return estimate
+
+        query = self._count_query(_clauses, kwargs)
+        started = self._observe_start()
+        rp, conn = self._execute_read(query)
+        try:
+            res = rp.fetchone()
+        finally:
+            if conn is not None:
+                conn.close()
+        self._observe(kwargs, started)
         if res is not None:
             return int(res[0])
         return 0
 
+    def _count_primary(self, *clauses: ColumnElement[bool], **filters: Any) -> int:
+        """Count matching rows on the primary, for writes that depend on it."""
+        if not self.exists:
+            return 0
+        query = self._count_query(clauses, filters)
+        return int(self.db.executable.execute(query).scalar_one())
+
+    def _approximate_count(self) -> int | None:
+        """Read the planner's row estimate for the table, if there is one."""
+        params: dict[str, Any] = {"name": self.name, "schema": self.db.schema}
+        if self.db.is_postgres:
+            query = text(
+                "SELECT c.reltuples FROM pg_class c "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relname = :name "
+                "AND n.nspname = COALESCE(:schema, current_schema())"
+            )
+        elif self.db.is_mysql:
+            query = text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_NAME = :name "
+                "AND TABLE_SCHEMA = COALESCE(:schema, DATABASE())"
+            )
+        elif self.db.is_sqlite:
+            prefix = f'"{self.db.schema}".' if self.db.schema else ""
+            query = text(f"SELECT stat FROM {prefix}sqlite_stat1 WHERE tbl = :name")
+            params.pop("schema")
+        else:
+            return None
+        try:
+            res = self.db.executable.execute(query, params).fetchone()
+        except DBAPIError:
+            # sqlite_stat1 only exists once ANALYZE has been run.
+            if not self.db.in_transaction:
+                self.db.executable.rollback()
+            return None
+        if res is None or res[0] is None:
+            return None
+        if self.db.is_sqlite:
+            return int(str(res[0]).split()[0])
+        # PostgreSQL reports -1 for tables that have never been analyzed.
+        estimate = int(res[0])
+        return estimate if estimate >= 0 else None
+
+    def cache_count(self, enabled: bool = True) -> None:
+        """Keep the row count returned by ``len(table)`` in memory.
+
+        Once enabled, the table is counted once and the number is then
+        adjusted by every insert and delete made through this table. Writes
+        from other processes or other ``Table`` objects are not seen.
+        ::
+
+            table.cache_count()
+            len(table)  # runs SELECT COUNT(*)
+            table.insert(dict(name='Dolly'))
+            len(table)  # no query
+        """
+        self._count_cached = enabled
+        self._row_count = None
+
     def __len__(self) -> int:
         """Return the number of rows in the table."""
-        return self.count()
+        if not self._count_cached:
+            return self.count()
+        if self._row_count is None:
+            self._row_count = self.count()
+        return self._row_count
 
     def distinct(
         self,
@@ -843,6 +1769,266 @@ class Table:
         if not self.exists:
             return ResultIter(None, row_type=self.db.row_type)
 
+        q = self._distinct_query(args, kwargs, _limit, _offset)
+        if q is None:
+            return ResultIter(None, row_type=self.db.row_type)
+        if self._cache is None:
+            return self.db.query(q, _readonly=True)
+        rp, conn = self._execute_read(q)
+        return ResultIter(rp, row_type=self.db.row_type, connection=conn)
+
+    def aggregate(
+        self,
+        *_clauses: ColumnElement[bool],
+        group_by: str | Sequence[str] | None = None,
+        count: bool | str | Sequence[str] = False,
+        sum: str | Sequence[str] | None = None,  # noqa: A002
+        avg: str | Sequence[str] | None = None,
+        min: str | Sequence[str] | None = None,  # noqa: A002
+        max: str | Sequence[str] | None = None,  # noqa: A002
+        order_by: str | Sequence[str] | None = None,
+        _limit: int | None = None,
+        _offset: int = 0,
+        **kwargs: SQLWriteValue,
+    ) -> ResultIter:
+        """Compute aggregates in the database, optionally per group.
+
+        Each of ``sum``, ``avg``, ``min`` and ``max`` takes one or more column
+        names; the result is labelled ``<function>_<column>``. ``count=True``
+        adds a ``count`` of rows, while ``count='column'`` counts the non-null
+        values of a column as ``count_<column>``. Filters work as in
+        :py:meth:`find() <dataset.Table.find>`, and ``order_by`` accepts both
+        grouped columns and result labels.
+        ::
+
+            # one row per country with the number and mean age of users
+            table.aggregate(group_by='country', count=True, avg='age')
+            # largest cities first
+            table.aggregate(group_by='city', sum='population',
+                            order_by='-sum_population', _limit=10)
+        """
+        if not self.exists:
+            return ResultIter(None, row_type=self.db.row_type)
+
+        def table_columns(names: str | Sequence[str] | None) -> list[Column[Any]]:
+            columns = []
+            for name in ensure_strings(names):
+                name = self._get_column_name(name)
+                if not self.has_column(name):
+                    raise DatasetError(f"No such column: {name}")
+                columns.append(self.table.c[name])
+            return columns
+
+        groups = table_columns(group_by)
+        labels: dict[str, ColumnElement[Any]] = {}
+        for column in groups:
+            labels[column.name] = column
+        if count is True:
+            labels["count"] = func.count().label("count")
+        elif count is not False:
+            for column in table_columns(count):
+                label = f"count_{column.name}"
+                labels[label] = func.count(column).label(label)
+        aggregates = (
+            ("sum", func.sum, sum),
+            ("avg", func.avg, avg),
+            ("min", func.min, min),
+            ("max", func.max, max),
+        )
+        for prefix, function, names in aggregates:
+            for column in table_columns(names):
+                label = f"{prefix}_{column.name}"
+                labels[label] = function(column).label(label)
+        if len(labels) == len(groups):
+            raise QueryError("aggregate() requires at least one aggregate")
+
+        orderings = []
+        for ordering in ensure_strings(order_by):
+            name = ordering.lstrip("-")
+            if name in labels:
+                expr: ColumnElement[Any] = labels[name]
+            elif self.has_column(name):
+                expr = self.table.c[self._get_column_name(name)]
+            else:
+                continue
+            orderings.append(expr.desc() if ordering.startswith("-") else expr.asc())
+
+        clause = self._args_to_clause(kwargs, clauses=_clauses)
+        q = (
+            select(*labels.values())
+            .select_from(self.table)
+            .where(clause)
+            .group_by(*groups)
+            .order_by(*orderings)
+            .limit(_limit)
+            .offset(_offset)
+        )
+        if self._cache is None:
+            return self.db.query(q, _readonly=True)
+        rp, conn = self._execute_read(q)
+        return ResultIter(rp, row_type=self.db.row_type, connection=conn)
+
+    def cache_results(
+        self, max_size: int = 128, ttl: float | None = None
+    ) -> LRUCache[FrozenResult[Any]]:
+        """Cache the results of ``find``, ``count`` and ``distinct``.
+
+        Results are kept for up to ``max_size`` distinct statements (keyed by
+        the compiled SQL and its parameters) and for at most ``ttl`` seconds.
+        Any write or schema change made through this table clears the cache,
+        again once it is committed, but changes made by other processes are
+        only seen after ``ttl`` expires. Streamed queries
+        (``_streamed=True``) and queries inside a transaction, which may see
+        uncommitted changes, bypass the cache.
+
+        Returns the :py:class:`LRUCache <dataset.cache.LRUCache>`, which
+        exposes ``hits``, ``misses`` and ``hit_ratio``.
+        ::
+
+            cache = table.cache_results(max_size=1000, ttl=60)
+            table.find_one(country='France')
+            print(cache.hit_ratio)
+        """
+        if self._cache is None:
+            self._cache = LRUCache(max_size, ttl)
+        self._cache.max_size = max_size
+        self._cache.ttl = ttl
+        return self._cache
+
+    def cached(
+        self,
+        max_rows: int = 1024,
+        ttl: float | None = None,
+        keys: Iterable[str | Sequence[str]] | None = None,
+    ) -> CachedTable:
+        """Cache rows looked up by primary key in memory.
+
+        Returns a :py:class:`CachedTable <dataset.cache.CachedTable>` view
+        whose ``find_one()`` and ``get_many()`` serve rows by primary key (or
+        by the unique column sets in ``keys``) from an LRU cache of up to
+        ``max_rows`` rows, kept for at most ``ttl`` seconds. Writes through
+        this table keep the cache up to date. The view reports ``hits``,
+        ``misses`` and ``hit_ratio``.
+        ::
+
+            countries = db['countries'].cached(max_rows=500)
+            country = countries.find_one(id=42)
+            by_id = countries.get_many([1, 2, 3])
+        """
+        if self._row_cache is None or keys is not None:
+            self._row_cache = CachedTable(self, max_rows, ttl, keys)
+        self._row_cache.rows.max_size = max_rows
+        self._row_cache.rows.ttl = ttl
+        return self._row_cache
+
+    def _execute_read(
+        self, query: Select[Any]
+    ) -> tuple[Result[Any], Connection | None]:
+        """Run a read query, serving it from the result cache if enabled.
+
+        Queries go to a read replica if the database has any. The replica
+        connection is returned with the result, to be closed by the caller
+        once the result has been consumed.
+        """
+        # Inside a transaction, results may include uncommitted changes.
+        cache = None if self.db.in_transaction else self._cache
+        key = None
+        if cache is not None:
+            key = statement_key(query, self.db.executable.dialect)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached(), None
+        conn = self.db._read_connection()
+        try:
+            rp = (conn or self.db.executable).execute(query)
+            if cache is None:
+                return rp, conn
+            frozen = rp.freeze()
+        except Exception:
+            if conn is not None:
+                conn.close()
+            raise
+        if conn is not None:
+            conn.close()
+        cache.set(key, frozen)
+        return frozen(), None
+
+    def _changed(
+        self, rows: int | None = None, filters: Mapping[str, Any] | None = None
+    ) -> None:
+        """Drop cached results after the table's data or schema changed.
+
+        ``rows`` is the change in the number of rows, if known; ``None``
+        invalidates the cached row count. ``filters`` are the equality
+        filters of an update or delete, which limit the rows to forget from
+        the row cache.
+
+        Other threads may cache the old data again until the change is
+        committed, so the caches are cleared once more after the commit.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+        # Inserts don't change rows that may have been cached.
+        inserted = rows is not None and rows > 0 and filters is None
+        if self._row_cache is not None and not inserted:
+            self._row_cache.invalidate(filters)
+        if self._cache is not None or self._row_cache is not None:
+            self.db._track_change(self, not inserted, filters)
+        if rows is None or self._row_count is None:
+            self._row_count = None
+        else:
+            self._row_count += rows
+
+    def _committed(self, forget: list[Mapping[str, Any]] | None) -> None:
+        """Drop cached results after changes to the table were committed.
+
+        ``forget`` holds the filters of the rows to forget from the row
+        cache, ``None`` to forget all rows.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+        if self._row_cache is None:
+            return
+        if forget is None:
+            self._row_cache.clear()
+            return
+        for filters in forget:
+            self._row_cache.invalidate(filters)
+
+    def _find_query(
+        self,
+        clauses: Iterable[ColumnElement[bool]],
+        filters: MutableRow,
+        limit: int | None = None,
+        offset: int | None = 0,
+        order_by: str | Sequence[str] | None = None,
+        columns: str | Sequence[str] | None = None,
+    ) -> Select[Any]:
+        orderings = self._args_to_order_by(order_by)
+        args = self._args_to_clause(filters, clauses=clauses)
+        if columns is None:
+            query = self.table.select()
+        else:
+            query = select(*self._args_to_columns(columns))
+        query = query.where(args).limit(limit).offset(offset)
+        if len(orderings):
+            query = query.order_by(*orderings)
+        return query
+
+    def _count_query(
+        self, clauses: Iterable[ColumnElement[bool]], filters: MutableRow
+    ) -> Select[Any]:
+        args = self._args_to_clause(filters, clauses=clauses)
+        query = select(func.count()).where(args)
+        return query.select_from(self.table)
+
+    def _distinct_query(
+        self,
+        args: Iterable[str | ColumnElement[bool]],
+        filters: MutableRow,
+        limit: int | None = None,
+        offset: int | None = 0,
+    ) -> Select[Any] | None:
         columns = []
         clauses = []
         for column in args:
@@ -853,19 +2039,76 @@ class Table:
                     raise DatasetError(f"No such column: {column}")
                 columns.append(self.table.c[column])
 
-        clause = self._args_to_clause(kwargs, clauses=clauses)
+        clause = self._args_to_clause(filters, clauses=clauses)
         if not len(columns):
-            return ResultIter(None, row_type=self.db.row_type)
+            return None
 
-        q = (
+        return (
             expression.select(*columns)
             .distinct()
             .where(clause)
-            .limit(_limit)
-            .offset(_offset)
+            .limit(limit)
+            .offset(offset)
             .order_by(*[c.asc() for c in columns])
         )
-        return self.db.query(q)
+
+    def explain(
+        self,
+        *_clauses: str | ColumnElement[bool],
+        _method: Literal["find", "count", "distinct"] = "find",
+        _limit: int | None = None,
+        _offset: int = 0,
+        order_by: str | Sequence[str] | None = None,
+        _columns: str | Sequence[str] | None = None,
+        _analyze: bool = False,
+        _warn_unindexed: bool = False,
+        **kwargs: SQLWriteValue,
+    ) -> list[OutRow]:
+        """Return the query plan for a ``find``, ``count`` or ``distinct``.
+
+        The statement is built exactly as the chosen ``_method`` would build
+        it and then passed to :py:meth:`db.explain() <dataset.Database.explain>`.
+        For ``distinct``, column names are given as positional arguments.
+        ::
+
+            for step in table.explain(country='France', order_by='year'):
+                print(step)
+            table.explain('year', _method='distinct', country='China')
+
+        With ``_warn_unindexed``, a ``RuntimeWarning`` is emitted for every
+        filter column not covered by an index (see
+        :py:meth:`has_index() <dataset.Table.has_index>`).
+        """
+        if not self.exists:
+            raise DatasetError(f"Table does not exist: {self.name}")
+        if _warn_unindexed:
+            for column in kwargs:
+                if self.has_column(column) and not self.has_index([column]):
+                    warnings.warn(
+                        f"No index on {self.name}.{self._get_column_name(column)}",
+                        RuntimeWarning,
+                        stacklevel=2,
+                    )
+        query: Select[Any] | None
+        if _method == "distinct":
+            query = self._distinct_query(_clauses, kwargs, _limit, _offset)
+            if query is None:
+                raise QueryError("distinct() requires at least one column")
+        else:
+            clauses = []
+            for clause in _clauses:
+                if isinstance(clause, str):
+                    raise QueryError("Column names are only valid for distinct()")
+                clauses.append(clause)
+            if _method == "count":
+                query = self._count_query(clauses, kwargs)
+            elif _method == "find":
+                query = self._find_query(
+                    clauses, kwargs, _limit, _offset, order_by, _columns
+                )
+            else:
+                raise QueryError(f"Cannot explain method: {_method}")
+        return self.db.explain(query, analyze=_analyze)
 
     # Legacy methods for running find queries.
     all = find
@@ -1,14 +1,17 @@
 from collections import OrderedDict
-from collections.abc import Callable, Iterable, Iterator, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache, partial
 from hashlib import sha1
-from typing import Any
+from itertools import islice
+from typing import Any, TypeGuard
 from urllib.parse import urlencode, urlparse
 
-from sqlalchemy import Connection, ResultProxy
+from sqlalchemy import Connection, Result
 from sqlalchemy.engine import Row
 from sqlalchemy.exc import ResourceClosedError
+from sqlalchemy.types import TypeEngine
 
 QUERY_STEP = 1000
 
@@ -40,7 +43,66 @@ RowFactory = Callable[[Iterable[tuple[str, Any]]], OutRow]
 row_factory: RowFactory = OrderedDict
 
 
+@lru_cache(maxsize=256)
+def _key_index(keys: tuple[str, ...]) -> dict[str, int]:
+    return {key: index for index, key in enumerate(keys)}
+
+
+class Record(Mapping[str, Any]):
+    """A compact, read-only row.
+
+    Pass ``row_type=dataset.Record`` to :py:func:`connect() <dataset.connect>`
+    to get query results as records instead of ``OrderedDict`` objects. Each
+    record keeps only a tuple of its values and shares the mapping of column
+    names to positions with all other rows of the same result, so large
+    results take much less memory and are faster to build. Records support
+    the read-only ``dict`` interface; use ``dict(record)`` to get a copy that
+    can be changed or serialized to JSON.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    _index: dict[str, int]
+    _values: tuple[Any, ...]
+
+    def __init__(self, items: Iterable[tuple[str, Any]] = ()) -> None:
+        pairs = list(items)
+        self._index = _key_index(tuple(key for key, _ in pairs))
+        self._values = tuple(value for _, value in pairs)
+
+    @classmethod
+    def _make(cls, index: dict[str, int], values: tuple[Any, ...]) -> "Record":
+        record = cls.__new__(cls)
+        record._index = index
+        record._values = values
+        return record
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._index[key]]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __reduce__(self) -> tuple[type["Record"], tuple[list[tuple[str, Any]]]]:
+        return (type(self), (list(self.items()),))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.items())!r})"
+
+
+def _is_record(factory: RowFactory) -> TypeGuard[type[Record]]:
+    return isinstance(factory, type) and issubclass(factory, Record)
+
+
 def convert_row(factory: RowFactory, row: Row[Any]) -> OutRow:
+    if _is_record(factory):
+        return factory._make(_key_index(row._fields), tuple(row))
     return factory(row._mapping.items())  # type: ignore[arg-type]
 
 
@@ -52,9 +114,7 @@ class QueryError(DatasetError):
     pass
 
 
-def iter_result_proxy(
-    rp: ResultProxy[Any], step: int | None = None
-) -> Iterator[Row[Any]]:
+def iter_result_proxy(rp: Result[Any], step: int | None = None) -> Iterator[Row[Any]]:
     """Iterate over the ResultProxy."""
     while True:
         chunk = rp.fetchall() if step is None else rp.fetchmany(size=step)
@@ -107,10 +167,11 @@ class ResultIter(Iterator[OutRow]):
 
     def __init__(
         self,
-        result_proxy: ResultProxy[Any] | None,
+        result_proxy: Result[Any] | None,
         row_type: RowFactory = row_factory,
         step: int | None = None,
         connection: Connection | None = None,
+        types: Sequence[TypeEngine[Any] | None] | None = None,
     ):
         self.row_type = row_type
         self.result_proxy = result_proxy
@@ -125,10 +186,18 @@ class ResultIter(Iterator[OutRow]):
             except ResourceClosedError:
                 self.keys = []
                 self._iter = iter([])
+        self._convert: Callable[[Row[Any]], OutRow] = partial(convert_row, row_type)
+        if _is_record(row_type):
+            # All rows of the result share one mapping of keys to positions.
+            index = _key_index(tuple(self.keys))
+            make = row_type._make
+            self._convert = lambda row: make(index, tuple(row))
+        # Column types, if known, used to pick array dtypes in to_numpy().
+        self.types = list(types) if types is not None else [None] * len(self.keys)
 
     def __next__(self) -> OutRow:
         try:
-            return convert_row(self.row_type, next(self._iter))
+            return self._convert(next(self._iter))
         except StopIteration:
             self.close()
             raise
@@ -138,6 +207,43 @@ class ResultIter(Iterator[OutRow]):
     def __iter__(self) -> Iterator[OutRow]:
         return self
 
+    def _batches(self, size: int) -> Iterator[list[Row[Any]]]:
+        try:
+            while batch := list(islice(self._iter, size)):
+                yield batch
+        finally:
+            self.close()
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Fetch the remaining rows into one numpy array per column.
+
+        Rows are read in batches and converted column by column, without
+        building a row object for each. Integer, float, boolean, date and
+        time columns get typed arrays; integer and boolean columns with
+        ``NULL`` values are returned as masked arrays. Requires numpy.
+        """
+        from dataset.frames import to_numpy
+
+        return to_numpy(self.keys, self.types, self._batches(QUERY_STEP))
+
+    def to_pandas(self) -> Any:
+        """Fetch the remaining rows into a ``pandas.DataFrame``.
+
+        Columns are typed as in :py:meth:`to_numpy`, with ``NULL`` values in
+        integer and boolean columns kept in pandas' nullable ``Int64`` and
+        ``boolean`` dtypes. Requires pandas.
+        """
+        from dataset.frames import to_pandas
+
+        return to_pandas(self.keys, self.types, self._batches(QUERY_STEP))
+
+    def iter_dataframes(self, chunk_rows: int = 10000) -> Iterator[Any]:
+        """Yield the remaining rows as ``pandas.DataFrame`` objects of at
+        most ``chunk_rows`` rows each, so only one chunk is held in memory."""
+        from dataset.frames import iter_dataframes
+
+        return iter_dataframes(self.keys, self.types, self._batches(chunk_rows))
+
     def close(self) -> None:
         if self.result_proxy is not None:
             self.result_proxy.close()
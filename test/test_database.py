@@ -1,12 +1,15 @@
+import io
+import json
 import tempfile
 import threading
 from collections import OrderedDict
 from datetime import datetime
 
 import pytest
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
 
-from dataset import connect
+from dataset import DatasetError, connect
+from dataset.files import json_default
 
 from .conftest import TEST_DATA
 
@@ -138,6 +141,46 @@ def test_query(db, table):
     assert r["num"] == len(TEST_DATA), r
 
 
+def test_explain_query(db, table):
+    plan = db.explain("SELECT * FROM weather WHERE place = :place", place="x")
+    assert len(plan) > 0, plan
+
+
+def test_export_query(db, table):
+    out = io.StringIO()
+    count = db.export_query(
+        "SELECT place, temperature FROM weather WHERE temperature > :t",
+        out,
+        t=0,
+        _format="csv",
+    )
+    assert count == 4, count
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "place,temperature", lines
+    assert len(lines) == 5, lines
+
+    out = io.StringIO()
+    db.export_query(
+        "SELECT place, temperature AS t, date AS t FROM weather ORDER BY id",
+        out,
+        _format="jsonl",
+    )
+    lines = out.getvalue().splitlines()
+    assert len(lines) == len(TEST_DATA), lines
+    row = next(db.query("SELECT place, date FROM weather ORDER BY id"))
+    expected = {"place": row["place"], "t": row["date"]}
+    assert lines[0] == json.dumps(expected, default=json_default), lines
+
+
+def test_export_query_transaction(db, table):
+    db.begin()
+    table.insert({"place": "Berlin"})
+    out = io.StringIO()
+    assert table.export(out, _format="csv") == len(TEST_DATA) + 1
+    db.commit()
+    assert len(table) == len(TEST_DATA) + 1, len(table)
+
+
 def test_table_cache_updates(db):
     tbl1 = db.get_table("people")
     data = OrderedDict([("first_name", "John"), ("last_name", "Smith")])
@@ -176,3 +219,145 @@ def test_thread_connections_released():
             f"Expected at most 1 connection, got {len(db.connections)}"
         )
         db.close()
+
+
+def _in_thread(func):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_cache_results_threads(tmp_path):
+    db = connect(f"sqlite:///{tmp_path / 'cache.db'}")
+    table = db["numbers"]
+    table.insert({"a": 1})
+    table.cache_results()
+    db.begin()
+    table.insert({"a": 2})
+    assert _in_thread(table.count) == 1
+    db.commit()
+    assert _in_thread(table.count) == 2
+    assert table.count() == 2
+    db.close()
+
+
+def test_cached_threads(tmp_path):
+    db = connect(f"sqlite:///{tmp_path / 'cache.db'}")
+    table = db["numbers"]
+    table.insert({"a": 1})
+    cached = table.cached()
+    db.begin()
+    table.update({"id": 1, "a": 5}, ["id"])
+    assert _in_thread(lambda: cached.find_one(id=1))["a"] == 1
+    db.commit()
+    assert _in_thread(lambda: cached.find_one(id=1))["a"] == 5
+    assert cached.find_one(id=1)["a"] == 5
+    db.close()
+
+
+def _pragma(db, name):
+    return next(iter(db.query(f"PRAGMA {name}").next().values()))
+
+
+def test_sqlite_profiles(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    db = connect(url, sqlite_profile="bulk_load")
+    assert _pragma(db, "synchronous") == 0
+    assert _pragma(db, "temp_store") == 2
+    db["weather"].insert_many(TEST_DATA)
+    db.close()
+
+    db = connect(url, sqlite_profile="read_serving")
+    assert len(db["weather"]) == len(TEST_DATA)
+    with pytest.raises(OperationalError):
+        db["weather"].insert({"temperature": 3})
+    db.close()
+
+    with pytest.raises(DatasetError):
+        connect(url, sqlite_profile="turbo")
+
+
+def test_sqlite_profile_switch(tmp_path):
+    db = connect(f"sqlite:///{tmp_path / 'profile.db'}")
+    synchronous = _pragma(db, "synchronous")
+    assert synchronous != 0
+    with db.sqlite_profile("bulk_load"):
+        assert _pragma(db, "synchronous") == 0
+        db["weather"].insert_many(TEST_DATA)
+    assert _pragma(db, "synchronous") == synchronous
+    assert len(db["weather"]) == len(TEST_DATA)
+    with pytest.raises(DatasetError), db, db.sqlite_profile("bulk_load"):
+        pass
+    db.close()
+
+
+def _replica_urls(tmp_path):
+    urls = []
+    for name in ("primary", "replica1", "replica2"):
+        url = f"sqlite:///{tmp_path / name}.db"
+        source = connect(url)
+        source["weather"].insert({"place": name})
+        source.close()
+        urls.append(url)
+    return urls
+
+
+def test_read_replicas(tmp_path):
+    primary, *replicas = _replica_urls(tmp_path)
+    db = connect(primary, read_urls=replicas)
+    table = db["weather"]
+    places = [table.find_one()["place"] for _ in range(4)]
+    assert places == ["replica1", "replica2", "replica1", "replica2"], places
+    assert table.count(place="replica1") == 1
+    assert db.replicas.reads == [3, 2]
+    rows = list(db.query("SELECT place FROM weather", _readonly=True))
+    assert rows[0]["place"] == "replica2"
+    assert list(db.query("SELECT place FROM weather"))[0]["place"] == "primary"
+    with db:
+        assert table.find_one()["place"] == "primary"
+    table.insert({"place": "primary"})
+    assert table.count() == 1
+    db.close()
+
+
+def test_read_replicas_read_your_writes(tmp_path):
+    primary, *replicas = _replica_urls(tmp_path)
+    db = connect(
+        primary,
+        read_urls=replicas,
+        read_strategy="least_loaded",
+        read_your_writes=60,
+    )
+    table = db["weather"]
+    results = table.find()
+    assert db.replicas.active == [1, 0]
+    # The open result keeps replica1 busy, so reads go to replica2.
+    assert table.find_one()["place"] == "replica2"
+    assert table.find_one()["place"] == "replica2"
+    results.close()
+    assert table.find_one()["place"] == "replica1"
+    table.insert({"place": "primary"})
+    assert table.count() == 2
+    db.close()
+
+    with pytest.raises(DatasetError):
+        connect(primary, read_urls=replicas, read_strategy="random")
+
+
+def test_read_replicas_writes(tmp_path):
+    primary, *replicas = _replica_urls(tmp_path)
+    db = connect(primary, read_urls=replicas)
+    table = db["weather"]
+    assert table.insert_ignore({"place": "x"}, ["place"]) is not False
+    assert table.insert_ignore({"place": "x"}, ["place"]) is False
+    assert table.insert_ignore({"place": "primary"}, ["place"]) is False
+    table.insert_ignore_many([{"place": "y", "temp": None}], ["place", "temp"])
+    table.insert_ignore_many([{"place": "y", "temp": None}], ["place", "temp"])
+    assert table.update({"place": "primary"}, ["place"]) == 1
+    db.close()
+    db = connect(primary)
+    assert db["weather"].count(place="x") == 1
+    assert db["weather"].count(place="y") == 1
+    db.close()
@@ -1,6 +1,11 @@
+import pickle
 from datetime import datetime
 
-from .conftest import TEST_CITY_1
+import pytest
+
+from dataset import Record
+
+from .conftest import TEST_CITY_1, TEST_DATA
 
 
 class Constructor(dict):
@@ -52,3 +57,24 @@ def test_iter(db, table):
         c += 1
         assert isinstance(row, Constructor), row
     assert c == len(table)
+
+
+def test_record(db, table):
+    db.row_type = Record
+    rows = list(table.find(place=TEST_CITY_1, order_by="date"))
+    assert len(rows) == 3, rows
+    row = rows[0]
+    assert isinstance(row, Record), row
+    assert row["temperature"] == 6
+    assert row.get("humidity") is None
+    assert "place" in row and "humidity" not in row
+    assert list(row) == ["id", "date", "temperature", "place"]
+    assert row == {"id": 4, **TEST_DATA[3]}
+    assert row._index is rows[1]._index
+    with pytest.raises(KeyError):
+        row["humidity"]
+    with pytest.raises(TypeError):
+        row["temperature"] = 7
+    assert pickle.loads(pickle.dumps(row)) == row
+    assert table.find_one(id=2)["temperature"] == -1
+    assert Record([("a", 1), ("b", 2)]) == {"a": 1, "b": 2}
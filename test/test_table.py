@@ -1,12 +1,18 @@
-from datetime import datetime
+import gzip
+import io
+import json
+import warnings
+from datetime import date, datetime
 
 import pytest
-from sqlalchemy.exc import ArgumentError
+from sqlalchemy.exc import ArgumentError, StatementError
 from sqlalchemy.types import BIGINT, TEXT
 
-from dataset import chunked
+from dataset import DatasetError, QueryError, chunked, connect
+from dataset.parallel import parallel_insert
+from dataset.sharding import ShardedTable
 
-from .conftest import TEST_CITY_1, TEST_DATA
+from .conftest import TEST_CITY_1, TEST_CITY_2, TEST_DATA
 
 
 def test_insert(table):
@@ -40,6 +46,30 @@ def test_insert_ignore_all_key(table):
     assert len(table) == len(TEST_DATA) + 1, len(table)
 
 
+def test_insert_ignore_many(table):
+    rows = [
+        {"date": datetime(2011, 1, 2), "temperature": -10, "place": "Berlin"},
+        {"date": datetime(2011, 1, 3), "temperature": -11, "place": "Berlin"},
+        {"date": datetime(2011, 1, 2), "temperature": -12, "place": TEST_CITY_1},
+        {"date": datetime(2011, 1, 4), "temperature": -13, "place": "Paris"},
+    ]
+    table.insert_ignore_many(rows, ["place"], chunk_size=3)
+    assert len(table) == len(TEST_DATA) + 2, len(table)
+    assert table.find_one(place="Berlin")["temperature"] == -10
+    table.insert_ignore_many(rows, ["place", "date"])
+    assert len(table) == len(TEST_DATA) + 3, len(table)
+
+
+def test_insert_ignore_many_unique(db):
+    table = db["unique_keys"]
+    table.insert({"code": "a", "value": 1})
+    table.create_index(["code"], unique=True)
+    rows = [{"code": c, "value": 2} for c in ("a", "b", "b", "c")]
+    table.insert_ignore_many(rows, ["code"], chunk_size=2)
+    assert len(table) == 3, len(table)
+    assert table.find_one(code="a")["value"] == 1
+
+
 def test_insert_json(table):
     last_id = table.insert(
         {
@@ -95,6 +125,209 @@ def test_upsert_id(db):
     assert len(table) == 1, len(table)
 
 
+def test_merge_from(table):
+    rows = [
+        {"date": datetime(2011, 1, 1), "place": TEST_CITY_1, "temperature": 16},
+        {"date": datetime(2011, 1, 4), "place": TEST_CITY_1, "temperature": 7},
+    ]
+    table.merge_from(rows, ["date", "place"], chunk_size=1)
+    assert len(table) == len(TEST_DATA) + 1, len(table)
+    row = table.find_one(date=datetime(2011, 1, 1), place=TEST_CITY_1)
+    assert row["temperature"] == 16, row
+    assert table.find_one(date=datetime(2011, 1, 4))["temperature"] == 7
+    table.merge_from(rows, ["date", "place"], delete_missing=True)
+    assert len(table) == 2, len(table)
+    assert table.count(place=TEST_CITY_2) == 0
+
+
+def test_merge_from_error(table):
+    rows = [
+        {"date": datetime(2011, 1, 1), "place": TEST_CITY_1, "temperature": 16},
+        {"date": datetime(2011, 1, 4), "place": object(), "temperature": 7},
+    ]
+    with pytest.raises(StatementError):
+        table.merge_from(rows, ["date", "place"], chunk_size=1)
+    assert not table.db.executable.in_transaction()
+    if table.db.is_sqlite:
+        assert not list(table.db.query("SELECT name FROM sqlite_temp_master"))
+    table.merge_from(rows[:1], ["date", "place"])
+    row = table.find_one(date=datetime(2011, 1, 1), place=TEST_CITY_1)
+    assert row["temperature"] == 16, row
+    assert len(table) == len(TEST_DATA), len(table)
+
+
+def test_load_csv(db, tmp_path):
+    path = tmp_path / "people.csv.gz"
+    with gzip.open(path, "wt", newline="") as fh:
+        fh.write("name,age,zip,height,born,member\n")
+        fh.write("Anna,31,01234,1.72,1990-04-01,true\n")
+        fh.write("Ben,,10115,1.8,1989-12-24,false\n")
+        fh.write("Cleo,7,99999,1.1,2015-06-30,\n")
+    table = db["people"]
+    assert table.load_csv(str(path), chunk_size=2, sample_size=2) == 3
+    assert len(table) == 3, len(table)
+    anna = table.find_one(name="Anna")
+    assert anna["age"] == 31, anna
+    assert anna["zip"] == "01234", anna
+    assert anna["height"] == 1.72, anna
+    assert anna["born"] == date(1990, 4, 1), anna
+    assert anna["member"] is True, anna
+    assert table.find_one(name="Ben")["age"] is None
+    assert table.find_one(name="Cleo")["member"] is None
+
+
+def test_load_jsonl(db):
+    lines = [
+        {"name": "Anna", "score": 1, "tags": ["a", "b"]},
+        {"name": "Ben", "score": 2.5, "tags": []},
+    ]
+    source = io.StringIO("\n".join(json.dumps(line) for line in lines) + "\n")
+    table = db["scores"]
+    assert table.load_jsonl(source) == 2
+    assert table.find_one(name="Ben")["score"] == 2.5
+    assert table.find_one(name="Anna")["tags"] == ["a", "b"]
+
+
+def test_export(db, table, tmp_path):
+    path = tmp_path / "weather.csv.gz"
+    assert table.export(str(path), place=TEST_CITY_1, order_by="date") == 3
+    copy = db["weather_copy"]
+    assert copy.load_csv(str(path)) == 3
+    assert copy.find_one(order_by="date")["date"] == datetime(2011, 1, 1)
+    assert copy.find_one(order_by="date")["temperature"] == 6
+
+    table.insert({"place": "Berlin", "info": {"population": 3292365}})
+    path = tmp_path / "weather.jsonl"
+    assert table.export(path, _columns=["place", "info"]) == len(TEST_DATA) + 1
+    with open(path) as fh:
+        lines = [json.loads(line) for line in fh]
+    assert lines[-1] == {"place": "Berlin", "info": {"population": 3292365}}
+    with pytest.raises(DatasetError):
+        table.export(tmp_path / "weather.xls")
+
+    path = tmp_path / "weather.tsv"
+    table.export(path, _columns=["place", "temperature"], place=TEST_CITY_1)
+    assert path.read_text().splitlines()[0] == "place\ttemperature"
+    assert db["weather_tsv"].load_csv(path, delimiter="\t") == 3
+    path = tmp_path / "weather.csv"
+    table.export(path, _columns=["place", "date"], _fmtparams={"delimiter": ";"})
+    assert path.read_text().splitlines()[0] == "place;date"
+
+
+def test_bulk_load(db):
+    table = db["weather"]
+    table.insert_many(TEST_DATA)
+    table.create_index(["place"])
+    table.create_index(["id", "date"], unique=True)
+    with table.bulk_load(analyze=True) as loading:
+        assert loading is table
+        assert not table.has_index(["place"])
+        assert table.has_index(["id", "date"])
+        table.insert_many([{"place": "Berlin", "temperature": i} for i in range(50)])
+        table.create_index(["temperature"])
+        assert not table.has_index(["temperature"])
+        with pytest.raises(DatasetError), table.bulk_load():
+            pass
+    assert table.has_index(["place"])
+    assert table.has_index(["temperature"])
+    assert len(table) == len(TEST_DATA) + 50
+
+    with pytest.raises(ValueError), table.bulk_load():
+        raise ValueError
+    assert table.has_index(["place"])
+
+    with table.bulk_load():
+        table.create_index(["date"])
+        table.create_index(["date"])
+        assert len(table._deferred_indexes) == 3, table._deferred_indexes
+        # Upserts look up rows by their keys, so that index is built at once.
+        for i in range(20):
+            table.upsert({"place": "Berlin", "temperature": i}, ["temperature"])
+        assert table.has_index(["temperature"])
+        assert len(table._deferred_indexes) == 2, table._deferred_indexes
+    assert table.has_index(["place"])
+    assert table.has_index(["date"])
+
+    if not db.is_mysql:
+        # Partial indexes can't be rebuilt as they were, so they are kept.
+        db.query("CREATE INDEX weather_partial ON weather (date) WHERE temperature > 0")
+        with table.bulk_load():
+            names = [i["name"] for i in db.inspect.get_indexes("weather")]
+            assert "weather_partial" in names
+
+
+def _parse_reading(line):
+    place, temperature = line.split(":")
+    return {"place": place, "temperature": int(temperature)}
+
+
+@pytest.mark.parametrize("single_writer", [True, False])
+def test_parallel_insert(tmp_path, single_writer):
+    url = f"sqlite:///{tmp_path / 'parallel.db'}"
+    lines = [f"city-{i % 7}:{i}" for i in range(500)]
+    count = parallel_insert(
+        url,
+        "readings",
+        lines,
+        _parse_reading,
+        processes=2,
+        chunk_size=30,
+        single_writer=single_writer,
+    )
+    assert count == 500, count
+    db = connect(url)
+    table = db["readings"]
+    assert len(table) == 500, len(table)
+    assert table.find_one(temperature=499)["place"] == "city-2"
+    db.close()
+
+
+@pytest.mark.parametrize("in_memory", [True, False])
+def test_sharded_table(tmp_path, in_memory):
+    if in_memory:
+        shards = [connect("sqlite:///:memory:") for _ in range(3)]
+    else:
+        shards = [connect(f"sqlite:///{tmp_path / str(i)}.db") for i in range(3)]
+    table = ShardedTable(shards, "weather", shard_key="place")
+    data = [
+        {"place": f"city-{i % 7}", "temperature": i, "date": date(2020, 1, 1 + i)}
+        for i in range(20)
+    ]
+    table.insert_many(data)
+    assert len(table) == 20
+    assert all(len(shard) for shard in table.shards)
+    for row in data:
+        assert table.shard_for(row).find_one(temperature=row["temperature"])
+
+    rows = list(table.find(order_by="-temperature", _limit=5, _offset=2))
+    assert [r["temperature"] for r in rows] == [17, 16, 15, 14, 13]
+    rows = list(table.find(place="city-3", order_by=["place", "date"]))
+    assert [r["temperature"] for r in rows] == [3, 10, 17]
+    assert table.count(temperature={">=": 10}) == 10
+    assert table.find_one(order_by="temperature")["temperature"] == 0
+
+    table.upsert_many([{"place": "city-3", "temperature": 99}], ["place"])
+    assert table.count(temperature=99) == 3
+    assert table.update({"temperature": 100, "date": date(2020, 1, 1)}, ["date"]) == 1
+    assert table.update({"place": "city-1", "date": date(2021, 1, 1)}, ["place"]) == 3
+    # The shard column is not a key here, so the update goes to all shards.
+    other = next(
+        f"city-{i}"
+        for i in range(1, 7)
+        if table.shard_for({"place": f"city-{i}"}) is not table.shard_for(data[5])
+    )
+    row = {"temperature": 5, "place": other, "date": date(2022, 1, 1)}
+    assert table.update(row, ["temperature"]) == 1
+    assert table.find_one(temperature=5)["date"] == date(2022, 1, 1)
+    assert table.delete(place="city-0")
+    assert len(table) == 17
+    with pytest.raises(QueryError):
+        list(table.find(order_by=[table.shards[0].table.c.place]))
+    table.drop()
+    for db in shards:
+        db.close()
+
+
 def test_update_while_iter(table):
     for row in table:
         row["foo"] = "bar"
@@ -283,6 +516,359 @@ def test_distinct(table):
     assert len(x) == 6, x
 
 
+def test_explain(table):
+    plan = table.explain(place=TEST_CITY_1, order_by="-date")
+    assert len(plan) > 0, plan
+    plan = table.explain(_method="count", temperature={">": 0})
+    assert len(plan) > 0, plan
+    plan = table.explain("place", _method="distinct", temperature=5)
+    assert len(plan) > 0, plan
+    with pytest.raises(QueryError):
+        table.explain(_method="distinct")
+
+
+def test_explain_warn_unindexed(table):
+    with pytest.warns(RuntimeWarning, match="place"):
+        table.explain(place=TEST_CITY_1, _warn_unindexed=True)
+    table.create_index(["place"])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        table.explain(place=TEST_CITY_1, _warn_unindexed=True)
+
+
+def test_advise_indexes(table):
+    advisor = table.advise_indexes(min_calls=3)
+    for _ in range(3):
+        list(table.find(place=TEST_CITY_1, temperature=5))
+        table.count(place=TEST_CITY_1)
+    table.delete(place="Atlantis")
+    suggested = {u.columns for u in advisor.suggestions()}
+    assert suggested == {("place",), ("place", "temperature")}, suggested
+    usage = {u.columns: u for u in advisor.usage}
+    assert usage[("place",)].calls == 4, usage
+    table.create_index(["place", "temperature"])
+    assert advisor.suggestions() == [], advisor.suggestions()
+
+
+def test_advise_indexes_auto(table):
+    table.advise_indexes(auto_index=True, min_calls=2)
+    table.find_one(temperature=5)
+    table.find_one(temperature=5)
+    assert not table.has_index(["temperature"])
+    table.find_one(temperature=5)
+    assert table.has_index(["temperature"])
+
+
+def test_cache_results(table):
+    cache = table.cache_results(max_size=2)
+    assert table.count(place=TEST_CITY_1) == 3
+    assert table.count(place=TEST_CITY_1) == 3
+    assert (cache.hits, cache.misses) == (1, 1), (cache.hits, cache.misses)
+    rows = list(table.find(place=TEST_CITY_1))
+    rows[0]["temperature"] = 100
+    again = list(table.find(place=TEST_CITY_1))
+    assert again[0]["temperature"] != 100, again
+    assert len(list(table.distinct("place"))) == 2
+    assert len(cache) == 2, len(cache)
+
+    table.insert({"place": TEST_CITY_1, "temperature": 3})
+    assert len(cache) == 0, len(cache)
+    assert table.count(place=TEST_CITY_1) == 4
+    table.delete(place=TEST_CITY_1)
+    assert table.find_one(place=TEST_CITY_1) is None
+
+
+def test_cache_results_transaction(db, table):
+    cache = table.cache_results()
+    assert table.count() == len(TEST_DATA)
+    db.begin()
+    table.insert({"place": TEST_CITY_1})
+    assert table.count() == len(TEST_DATA) + 1
+    assert len(cache) == 0
+    db.rollback()
+    assert table.count() == len(TEST_DATA)
+
+
+def test_cache_results_ttl(table):
+    cache = table.cache_results(ttl=0)
+    table.count()
+    table.count()
+    assert cache.hits == 0, cache.hits
+
+
+def test_count_approximate(db, table):
+    assert table.count(_approximate=True) >= 0
+    assert table.count(place=TEST_CITY_1, _approximate=True) == 3
+    if db.is_sqlite:
+        assert table.count(_approximate=True) == len(TEST_DATA)
+        db.query("ANALYZE")
+        table.insert({"place": "Berlin"})
+        assert table.count(_approximate=True) == len(TEST_DATA)
+
+
+def test_cached(table):
+    cached = table.cached(max_rows=4)
+    assert table.cached() is cached
+    row = cached.find_one(id=1)
+    assert row["temperature"] == 1
+    assert cached.find_one(id=1) == row
+    assert (cached.hits, cached.misses) == (1, 1)
+    # Returned rows are copies.
+    row["temperature"] = 100
+    assert cached.find_one(id=1)["temperature"] == 1
+
+    rows = cached.get_many([1, 2, 3, 99])
+    assert sorted(rows) == [1, 2, 3]
+    assert rows[2]["temperature"] == -1
+    assert len(cached) == 3
+
+    table.insert({"place": "Berlin", "temperature": 3})
+    assert len(cached) == 3
+    table.update({"id": 2, "temperature": 5}, ["id"])
+    assert len(cached) == 2
+    assert cached.find_one(id=2)["temperature"] == 5
+    table.update({"place": TEST_CITY_2, "temperature": 7}, ["place"])
+    assert len(cached) == 0
+    assert cached.find_one(id=1)["temperature"] == 7
+    table.delete(id=1)
+    assert cached.find_one(id=1) is None
+    assert cached.find_one(place=TEST_CITY_1)["place"] == TEST_CITY_1
+    # Tuple and set filters are IN lists, which drop all cached rows.
+    assert cached.get_many([2, 3, 4])[4]["temperature"] == 6
+    table.delete(id=(2, 3))
+    assert cached.find_one(id=2) is None
+    table.update({"id": {4}, "temperature": 9}, ["id"])
+    assert cached.find_one(id=4)["temperature"] == 9
+    table.delete(id={4})
+    assert cached.find_one(id=4) is None
+    assert not table.db.in_transaction
+    assert cached.hit_ratio > 0
+
+    by_place = table.cached(keys=[["place", "date"]])
+    row = by_place.find_one(place=TEST_CITY_1, date=datetime(2011, 1, 2))
+    assert row["temperature"] == 8
+    assert by_place.find_one(id=row["id"]) == row
+    assert by_place.hits == 1
+
+
+def test_cache_count(table):
+    table.cache_count()
+    assert len(table) == len(TEST_DATA)
+    table.insert({"place": "Berlin"})
+    table.insert_many([{"place": "Berlin"}] * 3)
+    table.upsert({"place": "Berlin", "temperature": 3}, ["place"])
+    assert len(table) == len(TEST_DATA) + 4, len(table)
+    table.delete(place="Berlin")
+    assert len(table) == len(TEST_DATA), len(table)
+    assert len(table) == table.count()
+
+
+def test_aggregate(table):
+    rows = list(
+        table.aggregate(
+            group_by="place",
+            count=True,
+            sum="temperature",
+            min="temperature",
+            max="temperature",
+            order_by="-sum_temperature",
+        )
+    )
+    assert len(rows) == 2, rows
+    assert rows[0]["place"] == TEST_CITY_1, rows
+    assert rows[0]["count"] == 3, rows
+    assert rows[0]["sum_temperature"] == 19, rows
+    assert rows[0]["min_temperature"] == 5, rows
+    assert rows[1]["max_temperature"] == 1, rows
+
+    rows = list(table.aggregate(avg="temperature", place=TEST_CITY_2))
+    assert len(rows) == 1, rows
+    assert rows[0]["avg_temperature"] == 0, rows
+
+    rows = list(table.aggregate(group_by=["place", "date"], count="temperature"))
+    assert len(rows) == 6, rows
+    assert rows[0]["count_temperature"] == 1, rows
+
+    with pytest.raises(QueryError):
+        table.aggregate(group_by="place")
+    with pytest.raises(DatasetError):
+        table.aggregate(sum="nonexistent")
+
+
+def test_prepared_lookup(table):
+    lookup = table.prepared_lookup(["place", "temperature"])
+    row = lookup(TEST_CITY_1, 8)
+    assert row["date"] == datetime(2011, 1, 2), row
+    assert lookup(TEST_CITY_1, 99) is None
+    assert len(table.prepared_lookup("place").all(TEST_CITY_2)) == 3
+    with pytest.raises(QueryError):
+        lookup(TEST_CITY_1)
+    with pytest.raises(QueryError):
+        table.prepared_lookup("humidity")
+
+    table.insert({"place": "Berlin", "temperature": 3, "humidity": 80})
+    assert lookup("Berlin", 3)["humidity"] == 80
+
+
+def test_insert_dataframe(db):
+    pd = pytest.importorskip("pandas")
+    np = pytest.importorskip("numpy")
+    df = pd.DataFrame(
+        {
+            "count": pd.array([1, None, 3], dtype="Int64"),
+            "price": [1.5, np.nan, 2.0],
+            "name": ["a", None, "c"],
+            "at": pd.to_datetime(
+                [datetime(2020, 1, 1), None, datetime(2020, 1, 3, 12)]
+            ),
+            "flag": [True, False, True],
+        }
+    )
+    tbl = db["frames"]
+    assert tbl.insert_dataframe(df, chunk_size=2) == 3
+    assert len(tbl) == 3
+    assert tbl.table.c["count"].type.python_type is int
+    assert tbl.table.c["price"].type.python_type is float
+    assert tbl.table.c["at"].type.python_type is datetime
+    rows = list(tbl.find(order_by="id"))
+    assert rows[0]["count"] == 1 and rows[0]["price"] == 1.5
+    assert rows[0]["at"] == datetime(2020, 1, 1)
+    assert rows[2]["at"] == datetime(2020, 1, 3, 12)
+    assert rows[1]["count"] is None and rows[1]["price"] is None
+    assert rows[1]["name"] is None and rows[1]["at"] is None
+    assert [bool(row["flag"]) for row in rows] == [True, False, True]
+
+    tbl.insert_dataframe(df.assign(other=1), ensure=False)
+    assert len(tbl) == 6
+    assert not tbl.has_column("other")
+    other = db["frames_typed"]
+    other.insert_dataframe(df, types={"count": db.types.float})
+    assert other.table.c["count"].type.python_type is float
+    with pytest.raises(DatasetError):
+        tbl.insert_dataframe(pd.DataFrame([[1, 2]], columns=["a", "a"]))
+
+
+def test_snapshot_mixed_types(db):
+    tbl = db["mixed"]
+    tbl.create_column("info", db.types.json)
+    values = [1, True, 1, 1, False, 0, 1, 1, True, 0]
+    tbl.insert_many([{"info": value} for value in values])
+    for index in (None, "info"):
+        snap = tbl.snapshot(index=index)
+        assert [(type(v), v) for v in snap.column("info")] == [
+            (type(v), v) for v in values
+        ]
+        assert len(snap.filter(info=True)) == 2
+        assert len(snap.filter(info=False)) == 1
+        assert snap.lookup(info=False)["id"] == 5
+    assert len(tbl.snapshot().filter(info=1)) == 5
+    # With mostly distinct values, the column is stored as a plain list.
+    tbl.delete(id=[7, 8, 9, 10])
+    snap = tbl.snapshot()
+    assert snap.column("info") == values[:6]
+    assert [row["id"] for row in snap.filter(info=True)] == [2]
+
+
+def test_to_pandas(db, table):
+    pd = pytest.importorskip("pandas")
+    np = pytest.importorskip("numpy")
+    table.insert({"place": "Nowhere", "temperature": None, "date": None})
+    df = table.to_pandas(order_by="id")
+    assert list(df.columns) == ["id", "date", "temperature", "place"]
+    assert len(df) == len(TEST_DATA) + 1
+    assert str(df["temperature"].dtype) == "Int64"
+    assert df["temperature"].isna().tolist() == [False] * 6 + [True]
+    assert df["date"].dtype.kind == "M"
+    assert df["date"][0] == pd.Timestamp(2011, 1, 1)
+    assert pd.isna(df["date"][6])
+
+    df = table.to_pandas(place=TEST_CITY_1, _columns=["temperature"])
+    assert df["temperature"].dtype == np.int64
+    assert df["temperature"].tolist() == [6, 8, 5]
+    assert len(table.to_pandas(place="Atlantis")) == 0
+
+    arrays = table.find(order_by="id").to_numpy()
+    assert isinstance(arrays["temperature"], np.ma.MaskedArray)
+    assert arrays["temperature"].mask.tolist() == [False] * 6 + [True]
+    assert arrays["place"].dtype == object
+    arrays = db.query("SELECT place, temperature FROM weather").to_numpy()
+    assert arrays["temperature"].dtype.kind == "i"
+
+    chunks = list(table.iter_dataframes(_chunk_rows=3, order_by="id"))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    places = [row["place"] for row in table.find(order_by="id")]
+    assert pd.concat(chunks)["place"].tolist() == places
+    assert list(db["nonexistent"].iter_dataframes()) == []
+
+
+def test_snapshot(table):
+    table.insert({"place": None, "temperature": None, "info": {"a": [1]}})
+    snap = table.snapshot(index=["id", ["place", "date"]])
+    assert len(snap) == len(TEST_DATA) + 1
+    assert list(snap) == list(table.find())
+    row = snap.lookup(place=TEST_CITY_1, date=datetime(2011, 1, 2))
+    assert row["temperature"] == 8
+    assert snap.lookup(id=7)["info"] == {"a": [1]}
+    assert snap.lookup(id=99) is None
+    assert len(snap.filter(place=TEST_CITY_2)) == 3
+    assert snap.filter(temperature=None)[0]["id"] == 7
+    assert snap.filter(place=TEST_CITY_2, temperature=-1)[0]["id"] == 2
+    assert sorted(snap.column("temperature"), key=str)[0] == -1
+    with pytest.raises(QueryError):
+        snap.lookup(humidity=3)
+
+    snap = table.snapshot(place=TEST_CITY_1, _columns=["place", "temperature"])
+    assert snap.columns == ["place", "temperature"]
+    assert snap.column("temperature") == [6, 8, 5]
+    assert len(table.db["nonexistent"].snapshot()) == 0
+
+
+def test_find_columns(table):
+    rows = list(table.find(place=TEST_CITY_1, _columns=["Place", "temperature"]))
+    assert len(rows) == 3, rows
+    assert list(rows[0].keys()) == ["place", "temperature"], rows[0]
+    row = table.find_one(_columns="-date", order_by="temperature")
+    assert "date" not in row, row
+    assert row["temperature"] == -1, row
+    with pytest.raises(DatasetError):
+        table.find(_columns=["nonexistent"])
+
+
+def test_delete_chunked(table):
+    progress = []
+    assert table.delete(place=TEST_CITY_1, _chunk_size=2, _callback=progress.append)
+    assert progress == [2, 3], progress
+    assert table.count(place=TEST_CITY_1) == 0
+    assert len(table) == 3, len(table)
+    assert not table.delete(place=TEST_CITY_1, _chunk_size=2)
+    with pytest.raises(DatasetError):
+        table.delete(place=TEST_CITY_2, _chunk_size=0)
+    assert len(table) == 3, len(table)
+
+
+def test_delete_many(table):
+    ids = [row["id"] for row in table.find(place=TEST_CITY_2)]
+    progress = []
+    deleted = table.delete_many(ids + [9999], chunk_size=2, callback=progress.append)
+    assert deleted == 3, deleted
+    assert progress == [2, 3], progress
+    assert table.count(place=TEST_CITY_2) == 0
+    assert table.delete_many([TEST_CITY_1], column="place") == 3
+    assert len(table) == 0, len(table)
+    with pytest.raises(DatasetError):
+        table.delete_many([1], column="nonexistent")
+
+
+def test_update_where(table):
+    n = table.update_where(
+        {"temperature": 100}, place=TEST_CITY_1, date={">": datetime(2011, 1, 1)}
+    )
+    assert n == 2, n
+    assert table.count(temperature=100) == 2
+    assert table.update_where({"foo": "bar"}, place=TEST_CITY_2) == 3
+    assert table.count(foo="bar") == 3
+
+
 def test_insert_many(table):
     data = TEST_DATA * 100
     table.insert_many(data, chunk_size=13)
@@ -312,6 +898,50 @@ def test_chunked_insert_callback(table):
     assert len(table) == len(data) + 6
 
 
+def test_chunked_insert_background(tmp_path):
+    db = connect(f"sqlite:///{tmp_path / 'chunked.db'}")
+    table = db["weather"]
+    data = TEST_DATA * 100
+    with chunked.ChunkedInsert(
+        table, chunksize=50, background=True, max_pending=2
+    ) as chunk_tbl:
+        for item in data:
+            chunk_tbl.insert(item)
+    assert len(table) == len(data), len(table)
+    assert chunk_tbl._writer is None
+
+    # flush() waits for the writer, without leaving a with block.
+    chunk_tbl = chunked.ChunkedInsert(table, chunksize=50, background=True)
+    for item in data[:101]:
+        chunk_tbl.insert(item)
+    chunk_tbl.flush()
+    assert len(table) == len(data) + 101, len(table)
+    chunk_tbl.close()
+    chunk_tbl = chunked.ChunkedInsert(table, chunksize=5, background=True)
+    chunk_tbl.insert({"place": object()})
+    with pytest.raises(StatementError):
+        chunk_tbl.flush()
+    with pytest.raises(StatementError):
+        chunk_tbl.close()
+    assert chunk_tbl._writer is None
+
+    chunk_tbl = chunked.ChunkedInsert(table, chunksize=5, background=True)
+    with pytest.raises(StatementError), chunk_tbl:
+        for _ in range(100):
+            chunk_tbl.insert({"place": object()})
+    assert chunk_tbl._writer is None
+    with pytest.raises(DatasetError):
+        chunked.ChunkedInsert(table, background=True, max_pending=0)
+    db.close()
+
+
+def test_chunked_insert_background_memory():
+    db = connect("sqlite:///:memory:")
+    with pytest.raises(DatasetError):
+        chunked.ChunkedInsert(db["weather"], background=True)
+    db.close()
+
+
 def test_update_many(db):
     tbl = db["update_many_test"]
     tbl.insert_many([{"temp": 10}, {"temp": 20}, {"temp": 30}])
@@ -342,6 +972,27 @@ def test_chunked_update(db):
     assert tbl.find_one(id=2)["location"] == tbl.find_one(id=3)["location"] == "asdf"
 
 
+def test_chunked_update_groups_by_columns(db, monkeypatch):
+    tbl = db["update_many_test"]
+    tbl.insert_many([{"temp": i, "location": "asdf"} for i in range(6)])
+    calls = []
+    update_many = tbl.update_many
+
+    def counting_update_many(rows, keys, **kwargs):
+        calls.append(len(rows))
+        update_many(rows, keys, **kwargs)
+
+    monkeypatch.setattr(tbl, "update_many", counting_update_many)
+    with chunked.ChunkedUpdate(tbl, ["id"]) as chunked_tbl:
+        chunked_tbl.update({"id": 1, "temp": 50})
+        chunked_tbl.update({"location": "qwer", "id": 2})
+        chunked_tbl.update({"temp": 51, "id": 3})
+        chunked_tbl.update({"id": 4, "location": "zxcv"})
+    assert sorted(calls) == [2, 2], calls
+    assert tbl.find_one(id=3)["temp"] == 51
+    assert tbl.find_one(id=4)["location"] == "zxcv"
+
+
 def test_upsert_many(db):
     # Also tests updating on records with different attributes
     tbl = db["upsert_many_test"]